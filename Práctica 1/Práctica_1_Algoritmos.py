@@ -93,10 +93,9 @@ def aleatorio(n) -> list:
     Retorna:
         list: Lista de enteros aleatorios.
     """
-    v=list(range(n))
-    for i in v:
-        v[i] = random.randint(-n, n)
-    return v
+    #choices saca los n valores de una vez, sin construir antes
+    #list(range(n)) ni llamar a randint por cada elemento.
+    return random.choices(range(-n, n + 1), k=n)
 
 def microsegundos() -> float:
     """
@@ -1,5 +1,7 @@
 import time
 import random
+import operator
+from itertools import islice
 from typing import Callable
 
 def ord_insercion(v: list) -> list:
@@ -73,7 +75,7 @@ def aleatorio(size:int):
     list[int]
         Lista de `size` enteros aleatorios en el intervalo [-size, size].
     """
-    return [random.randint(-size,size) for _ in range(size)]
+    return random.choices(range(-size, size + 1), k=size)
 
 def ascendente(size:int):
     """Genera una lista ordenada ascendentemente de 1 a n.
@@ -136,18 +138,70 @@ def ordenado(v:list[int]) -> bool:
         True si `v` está ordenada de forma no decreciente,
         False en caso contrario.
     """
-    n = len(v)
-    for i in range(1, n):
-        if v[i] < v[i-1]:
-            return False
-    return True
+    # Compara pares consecutivos en C en lugar de con un bucle Python
+    return all(map(operator.le, v, islice(v, 1, None)))
+
+_SALES = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F)
+_MASCARA64 = (1 << 64) - 1
+
+def huella(v:list[int]) -> tuple[int, int, int]:
+    """Huella de multiconjunto de una lista, independiente del orden.
+
+    Número de elementos y sumas (mod 2^64) de dos mezclas splitmix64 de
+    cada valor, calculadas en una sola pasada sin copiar ni ordenar `v`.
+    Es la misma huella que usa la práctica 3.
+
+    Parameters
+    ----------
+    v : list[int]
+        Lista de enteros.
+
+    Returns
+    -------
+    tuple[int, int, int]
+        Iguales para dos listas con los mismos elementos (con repetición).
+    """
+    # hash() no sirve: hash(-1) == hash(-2) y reduce módulo 2^61 - 1
+    m, c1, c2 = _MASCARA64, 0xBF58476D1CE4E5B9, 0x94D049BB133111EB
+    sal0, sal1 = _SALES
+    suma0 = suma1 = 0
+    for x in v:
+        x &= m
+        z = (x + sal0) & m
+        z = ((z ^ (z >> 30)) * c1) & m
+        z = ((z ^ (z >> 27)) * c2) & m
+        suma0 += z ^ (z >> 31)
+        z = (x + sal1) & m
+        z = ((z ^ (z >> 30)) * c1) & m
+        z = ((z ^ (z >> 27)) * c2) & m
+        suma1 += z ^ (z >> 31)
+    return len(v), suma0 & m, suma1 & m
+
+def verificar(huella_entrada:tuple[int, int, int], salida:list[int]) -> bool:
+    """Comprueba que `salida` está ordenada y es permutación de la entrada.
+
+    Parameters
+    ----------
+    huella_entrada : tuple[int, int, int]
+        Huella del vector original, tomada antes de ordenar (los
+        algoritmos ordenan in-place).
+    salida : list[int]
+        Lista resultante de la ordenación.
+
+    Returns
+    -------
+    bool
+        True si `salida` está ordenada y tiene la misma huella.
+    """
+    return ordenado(salida) and huella(salida) == huella_entrada
 
 def Test_sort_algorithms(ord_shell:Callable, ord_insercion:Callable,
 gen_vector:Callable, size_vector:int) -> bool:
     """Valida el correcto funcionamiento de los algoritmos de ordenación.
     Ejecuta tests básicos mostrando resultados por pantalla según el formato
     del enunciado. Prueba Shell sort con distintas secuencias de incrementos
-    y comprobación con insertion sort en casos específicos.
+    y comprobación con insertion sort en casos específicos. Comprueba orden
+    y permutación; los vectores solo se imprimen si son pequeños (n <= 20).
     """
     ord_insercion_correct, ord_shell_correct, inc_seq = True, True, []
     secuencias = (seq_hibbard, seq_knuth, seq_sedgewick, seq_ciura)
@@ -158,21 +212,27 @@ gen_vector:Callable, size_vector:int) -> bool:
         if i < 4:
             print("Inicialización Aleatoria:")
             v = gen_vector(size_vector)
-            print(v)
+            h = huella(v)
+            if size_vector <= 20:
+                print(v)
             print(f"Ordenación Shell Incrementos {secuencias[i].__name__}")
             resultado = ord_shell(v, inc_seq[i])
-            print(resultado)
-            is_sorted = ordenado(resultado)
+            if size_vector <= 20:
+                print(resultado)
+            is_sorted = verificar(h, resultado)
             print("Ordenado?", is_sorted, "\n")
             if not is_sorted:
                 ord_shell_correct = False
         else:
             print(f"Inicialización {casos_insercion[i-4].__name__}:")
             v = casos_insercion[i-4](size_vector)
-            print(v)
+            h = huella(v)
+            if size_vector <= 20:
+                print(v)
             resultado = ord_insercion(v)
-            print(resultado)
-            is_sorted = ordenado(resultado)
+            if size_vector <= 20:
+                print(resultado)
+            is_sorted = verificar(h, resultado)
             print("Ordenado?", is_sorted, "\n")
             if not is_sorted:
                 ord_insercion_correct = False
@@ -189,17 +249,23 @@ def medir_tiempo_ejecucion(alg: Callable, gen_vector: Callable,
     """Mide el tiempo de ejecución de un algoritmo de ordenación.
 
     Aplica corrección empírica para tiempos pequeños (< 1000 µs) realizando
-    K ejecuciones para obtener un promedio más estable.
+    K ejecuciones para obtener un promedio más estable. Si basta una sola
+    ejecución (t >= 1000 µs) su salida se verifica (orden y huella) fuera
+    del cronómetro; con K repeticiones no se verifica.
     Parameters
     """
     vector_tiempo = {}
     n = muestra_inicial
     for _ in range(muestras):
         vector = gen_vector(n)
+        h = huella(vector)
         ta = microsegundos()
         alg(vector)
         td = microsegundos()
         t = td - ta
+        if t >= 1000 and not verificar(h, vector):
+            raise Exception(f"Salida incorrecta para n={n}: no está "
+                            "ordenada o no es permutación de la entrada.")
         bucles = " "
         if t < 1000:
             bucles = "*"
@@ -1,15 +1,38 @@
 import time
 import random
-from typing import Callable, List, Tuple, Dict
+from typing import Callable, List, Tuple, Dict, Iterator, IO, Sequence
 import math
+from bisect import bisect_left, bisect_right
+import os
+import heapq
+import tempfile
+import json
+import operator
+import sys
+from array import array
+from contextlib import contextmanager
+from itertools import islice, accumulate
+
+# NumPy es opcional: se usa como backend más de los buffers tipados y para
+# vectorizar la verificación (huella); sin él todo funciona en Python puro
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # ------------------------------
 # Algoritmos de ordenación
 # ------------------------------
 
+# ord_insercion, ord_shell y ord_rapida solo usan len() e indexación, así
+# que además de listas ordenan in place buffers tipados de int64:
+# array('q'), memoryview con formato 'q' y arrays de NumPy (ver a_buffer).
+# ord_natural, ord_enteros y ordenar también: sus escrituras por tramos
+# pasan por _como, que adapta la lista al tipo del buffer.
+
 def ord_insercion(v: List[int]) -> List[int]:
     """
-    Ordena una lista mediante el algoritmo de Inserción (in place).
+    Ordena una lista (o buffer int64) mediante Inserción (in place).
     """
     for i in range(1, len(v)):
         x = v[i]
@@ -20,6 +43,31 @@ def ord_insercion(v: List[int]) -> List[int]:
         v[j + 1] = x
     return v
 
+def seq_ciura(limit: int) -> List[int]:
+    """
+    Incrementos de Ciura extendidos (x2.25) hasta limit (de la práctica 2).
+    """
+    seq = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+    while int(seq[-1] * 2.25) <= limit:
+        seq.append(int(seq[-1] * 2.25))
+    return seq
+
+def ord_shell(v: List[int], inc: List[int]) -> List[int]:
+    """
+    Ordenación de Shell (in place) con la secuencia de incrementos inc.
+    """
+    n = len(v)
+    for k in range(len(inc) - 1, -1, -1):
+        h = inc[k]
+        for i in range(h, n):
+            x = v[i]
+            j = i
+            while j >= h and v[j - h] > x:
+                v[j] = v[j - h]
+                j -= h
+            v[j] = x
+    return v
+
 def mediana3(v: List[int], i: int, j: int) -> None:
     """
     Median-of-3: reordena v[i], v[k], v[j] y deja la mediana en v[i] (pivote).
@@ -34,25 +82,33 @@ def mediana3(v: List[int], i: int, j: int) -> None:
     # La mediana queda en v[k]; colócala en v[i]
     v[i], v[k] = v[k], v[i]
 
+def particion(v: List[int], izq: int, der: int) -> int:
+    """
+    Partición con mediana de tres sobre v[izq..der] (izq < der).
+    Devuelve la posición final j del pivote: v[izq..j-1] <= v[j] <= v[j+1..der].
+    """
+    mediana3(v, izq, der)
+    piv = v[izq]
+    i, j = izq, der
+    while True:
+        i += 1
+        while i <= der and v[i] < piv:
+            i += 1
+        j -= 1
+        while j >= izq and v[j] > piv:
+            j -= 1
+        if j <= i:
+            break
+        v[i], v[j] = v[j], v[i]
+    v[izq], v[j] = v[j], v[izq]
+    return j
+
 def ord_rapida_aux(v: List[int], izq: int, der: int, umbral: int) -> None:
     """
     Quicksort (recursivo) con mediana de tres y umbral.
     """
     if izq + umbral <= der:
-        mediana3(v, izq, der)
-        piv = v[izq]
-        i, j = izq, der
-        while True:
-            i += 1
-            while i <= der and v[i] < piv:
-                i += 1
-            j -= 1
-            while j >= izq and v[j] > piv:
-                j -= 1
-            if j <= i:
-                break
-            v[i], v[j] = v[j], v[i]
-        v[izq], v[j] = v[j], v[izq]
+        j = particion(v, izq, der)
         ord_rapida_aux(v, izq, j - 1, umbral)
         ord_rapida_aux(v, j + 1, der, umbral)
 
@@ -60,19 +116,400 @@ def ord_rapida(v: List[int], umbral: int) -> List[int]:
     """
     Quicksort con mediana de tres y umbral; inserción final si umbral>1.
     """
-    if not v:
+    if len(v) == 0:  # no "not v": ambiguo con arrays de NumPy
         return v
     ord_rapida_aux(v, 0, len(v) - 1, umbral)
     if umbral > 1:
         ord_insercion(v)  # "peina" los segmentos pequeños
     return v
 
+def ord_rapida_dual_aux(v: List[int], izq: int, der: int, umbral: int) -> None:
+    """
+    Quicksort de doble pivote (Yaroslavskiy) con umbral.
+    Los pivotes p <= q se toman en los tercios del segmento para no
+    degenerar con vectores ya ordenados (mismo papel que mediana3).
+    """
+    if izq + umbral <= der:
+        tercio = (der - izq + 1) // 3
+        if tercio > 0:
+            a, b = izq + tercio, der - tercio
+            v[izq], v[a] = v[a], v[izq]
+            v[der], v[b] = v[b], v[der]
+        if v[izq] > v[der]:
+            v[izq], v[der] = v[der], v[izq]
+        p, q = v[izq], v[der]
+        lt, gt, k = izq + 1, der - 1, izq + 1
+        # Invariante: v[izq+1..lt-1] < p, p <= v[lt..k-1] <= q, v[gt+1..der-1] > q
+        while k <= gt:
+            x = v[k]
+            if x < p:
+                v[k], v[lt] = v[lt], x
+                lt += 1
+            elif x > q:
+                while v[gt] > q and k < gt:
+                    gt -= 1
+                v[k], v[gt] = v[gt], x
+                gt -= 1
+                x = v[k]
+                if x < p:
+                    v[k], v[lt] = v[lt], x
+                    lt += 1
+            k += 1
+        lt -= 1
+        gt += 1
+        v[izq], v[lt] = v[lt], v[izq]
+        v[der], v[gt] = v[gt], v[der]
+        ord_rapida_dual_aux(v, izq, lt - 1, umbral)
+        if p < q:
+            ord_rapida_dual_aux(v, lt + 1, gt - 1, umbral)
+        ord_rapida_dual_aux(v, gt + 1, der, umbral)
+
+def ord_rapida_dual(v: List[int], umbral: int) -> List[int]:
+    """
+    Quicksort de doble pivote con umbral; inserción final si umbral>1.
+    """
+    if len(v) == 0:
+        return v
+    ord_rapida_dual_aux(v, 0, len(v) - 1, umbral)
+    if umbral > 1:
+        ord_insercion(v)
+    return v
+
+# ------------------------------
+# Mezcla natural (aprovecha tramos ya ordenados)
+# ------------------------------
+
+# Tramos más cortos se alargan con inserción binaria; tras MIN_GALOPE
+# victorias seguidas de un mismo lado la mezcla copia en bloque (galope).
+MIN_TRAMO = 32
+MIN_GALOPE = 7
+
+def _como(v, valores: List[int]):
+    """
+    Devuelve valores en el mismo tipo de contenedor que v, para poder
+    asignarlo a un tramo de v: array y memoryview no aceptan listas.
+    """
+    if isinstance(v, array):
+        return array(v.typecode, valores)
+    if isinstance(v, memoryview):
+        return memoryview(array(v.format, valores))
+    if np is not None and isinstance(v, np.ndarray):
+        return np.array(valores, dtype=v.dtype)
+    return valores
+
+def _tramos_naturales(v: List[int]) -> List[int]:
+    """
+    Detecta tramos ascendentes (invierte los estrictamente descendentes) y
+    alarga los cortos hasta MIN_TRAMO. Devuelve los inicios de cada tramo
+    seguidos de len(v).
+    """
+    n = len(v)
+    cortes = [0]
+    i = 0
+    while i < n:
+        j = i + 1
+        if j < n and v[j] < v[i]:
+            while j + 1 < n and v[j + 1] < v[j]:
+                j += 1
+            j += 1
+            v[i:j] = v[i:j][::-1]
+        else:
+            while j < n and v[j] >= v[j - 1]:
+                j += 1
+        fin = min(n, i + MIN_TRAMO)
+        while j < fin:
+            # inserción binaria de v[j] en v[i..j-1]
+            x = v[j]
+            pos = bisect_right(v, x, i, j)
+            v[pos + 1:j + 1] = v[pos:j]
+            v[pos] = x
+            j += 1
+        cortes.append(j)
+        i = j
+    return cortes
+
+def _mezclar(v: List[int], a: int, b: int, c: int, aux: List[int]) -> None:
+    """
+    Mezcla v[a..b-1] y v[b..c-1] usando aux como buffer. Antes de mezclar
+    descarta por búsqueda binaria lo que ya está en su sitio.
+    """
+    a = bisect_right(v, v[b], a, b)
+    if a == b:
+        return
+    c = bisect_left(v, v[b - 1], b, c)
+    n1 = b - a
+    aux[0:n1] = v[a:b]
+    i, j, k = 0, b, a
+    gana_izq = gana_der = 0
+    while i < n1 and j < c:
+        if v[j] < aux[i]:
+            v[k] = v[j]
+            k += 1
+            j += 1
+            gana_der += 1
+            gana_izq = 0
+            if gana_der >= MIN_GALOPE:
+                m = bisect_left(v, aux[i], j, c)
+                v[k:k + m - j] = v[j:m]
+                k += m - j
+                j = m
+                gana_der = 0
+        else:
+            v[k] = aux[i]
+            k += 1
+            i += 1
+            gana_izq += 1
+            gana_der = 0
+            if gana_izq >= MIN_GALOPE and j < c:
+                m = bisect_right(aux, v[j], i, n1)
+                v[k:k + m - i] = aux[i:m]
+                k += m - i
+                i = m
+                gana_izq = 0
+    if i < n1:
+        v[k:k + n1 - i] = aux[i:n1]
+
+def ord_natural(v: List[int]) -> List[int]:
+    """
+    Mezcla natural (in place): detecta tramos ya ordenados y los mezcla
+    por parejas con galope, reutilizando un único buffer auxiliar del
+    mismo tipo que v (lista o buffer tipado).
+    O(n) si v ya está ordenado (o al revés), O(n log n) en el peor caso.
+    """
+    cortes = _tramos_naturales(v)
+    if len(cortes) <= 2:
+        return v
+    aux = _como(v, [0] * len(v))
+    while len(cortes) > 2:
+        nuevos = [0]
+        for t in range(2, len(cortes), 2):
+            _mezclar(v, cortes[t - 2], cortes[t - 1], cortes[t], aux)
+            nuevos.append(cortes[t])
+        if len(cortes) % 2 == 0:
+            nuevos.append(cortes[-1])
+        cortes = nuevos
+    return v
+
+# ------------------------------
+# Ordenación de enteros sin comparaciones
+# ------------------------------
+
+# Por encima de RANGO_CONTEO_POR_ELEMENTO * n valores posibles el vector de
+# cuentas deja de compensar y se pasa a radix por bytes.
+RANGO_CONTEO_POR_ELEMENTO = 4
+RANGO_CONTEO_MINIMO = 1024
+
+def ord_conteo(v: List[int], minimo: int, maximo: int) -> List[int]:
+    """
+    Counting sort para enteros en [minimo, maximo]. O(n + k), k = rango.
+    """
+    cuenta = [0] * (maximo - minimo + 1)
+    for x in v:
+        cuenta[x - minimo] += 1
+    i = 0
+    for valor, c in enumerate(cuenta, minimo):
+        if c:
+            v[i:i + c] = _como(v, [valor] * c)
+            i += c
+    return v
+
+def ord_radix(v: List[int], minimo: int, maximo: int) -> List[int]:
+    """
+    Radix sort LSD por bytes (256 cubetas por pasada) sobre v - minimo,
+    así los negativos no necesitan trato aparte. O(n · bytes del rango).
+    """
+    w = [x - minimo for x in v]
+    bits = (maximo - minimo).bit_length()
+    desp = 0
+    while desp < bits:
+        cubetas: List[List[int]] = [[] for _ in range(256)]
+        for x in w:
+            cubetas[(x >> desp) & 255].append(x)
+        w = [x for cubeta in cubetas for x in cubeta]
+        desp += 8
+    v[:] = _como(v, [x + minimo for x in w])
+    return v
+
+def ord_enteros(v: List[int]) -> List[int]:
+    """
+    Ordena enteros sin comparaciones (in place): counting sort si el rango
+    observado [min, max] es pequeño respecto a n, radix por bytes si no.
+    """
+    if len(v) < 2:
+        return v
+    minimo, maximo = min(v), max(v)
+    rango = maximo - minimo + 1
+    if rango <= max(RANGO_CONTEO_MINIMO, RANGO_CONTEO_POR_ELEMENTO * len(v)):
+        return ord_conteo(v, minimo, maximo)
+    return ord_radix(v, minimo, maximo)
+
+# ------------------------------
+# Ordenación externa (ficheros mayores que la memoria)
+# ------------------------------
+
+# Elementos por lectura/escritura en bloque y máximo de tramos mezclados a la
+# vez; la memoria queda acotada por max_elementos + MAX_VIAS bloques.
+TAM_BLOQUE_ES = 1 << 16
+MAX_VIAS = 64
+
+def _leer_bloques(f: IO, binario: bool) -> Iterator[List[int]]:
+    """
+    Lee enteros del fichero abierto f en bloques de TAM_BLOQUE_ES
+    (int64 nativos si binario, uno por línea si no).
+    """
+    while True:
+        if binario:
+            a = array("q")
+            try:
+                a.fromfile(f, TAM_BLOQUE_ES)
+            except EOFError:
+                pass  # fromfile deja en a lo que sí pudo leer
+            bloque = a.tolist()
+        else:
+            bloque = [int(linea) for linea in f.readlines(TAM_BLOQUE_ES * 8)]
+        if not bloque:
+            return
+        yield bloque
+
+def _escribir_bloque(f: IO, bloque: List[int], binario: bool) -> None:
+    if binario:
+        array("q", bloque).tofile(f)
+    elif bloque:
+        f.write("\n".join(map(str, bloque)) + "\n")
+
+def _abrir(ruta: str, modo: str, binario: bool) -> IO:
+    if binario:
+        return open(ruta, modo + "b", buffering=TAM_BLOQUE_ES * 8)
+    return open(ruta, modo, encoding="ascii", buffering=TAM_BLOQUE_ES * 8)
+
+def _leer_tramo(ruta: str, binario: bool) -> Iterator[int]:
+    with _abrir(ruta, "r", binario) as f:
+        for bloque in _leer_bloques(f, binario):
+            yield from bloque
+
+def _mezclar_tramos(rutas: List[str], salida: str, binario: bool) -> None:
+    """
+    Mezcla k-vías con un montículo (heapq.merge) y escribe en bloques.
+    """
+    with _abrir(salida, "w", binario) as f:
+        bloque: List[int] = []
+        for x in heapq.merge(*(_leer_tramo(r, binario) for r in rutas)):
+            bloque.append(x)
+            if len(bloque) >= TAM_BLOQUE_ES:
+                _escribir_bloque(f, bloque, binario)
+                bloque = []
+        _escribir_bloque(f, bloque, binario)
+
+def ordenar_externo(entrada: str, salida: str, binario: bool = True,
+                    max_elementos: int = 1 << 20,
+                    umbral: int = 10) -> Dict[str, float]:
+    """
+    Ordena un fichero de enteros sin cargarlo entero en memoria:
+    1) corta la entrada en tramos de max_elementos, los ordena con
+       ord_rapida y los vuelca a ficheros temporales;
+    2) mezcla los tramos de MAX_VIAS en MAX_VIAS hasta dejar uno solo.
+    Devuelve {bytes, tramos, segundos, MB/s}.
+    """
+    ta = time.perf_counter()
+    tam_bytes = os.path.getsize(entrada)
+    with tempfile.TemporaryDirectory() as dir_tmp:
+        tramos: List[str] = []
+        with _abrir(entrada, "r", binario) as f:
+            tramo: List[int] = []
+            for bloque in _leer_bloques(f, binario):
+                tramo.extend(bloque)
+                while len(tramo) >= max_elementos:
+                    tramos.append(_volcar_tramo(tramo[:max_elementos], dir_tmp,
+                                                len(tramos), binario, umbral))
+                    del tramo[:max_elementos]
+            if tramo or not tramos:
+                tramos.append(_volcar_tramo(tramo, dir_tmp, len(tramos),
+                                            binario, umbral))
+        n_tramos = len(tramos)
+        siguiente = n_tramos
+        while len(tramos) > MAX_VIAS:
+            grupo, tramos = tramos[:MAX_VIAS], tramos[MAX_VIAS:]
+            ruta = os.path.join(dir_tmp, f"tramo{siguiente}")
+            _mezclar_tramos(grupo, ruta, binario)
+            for r in grupo:
+                os.remove(r)
+            tramos.append(ruta)
+            siguiente += 1
+        _mezclar_tramos(tramos, salida, binario)
+    segundos = time.perf_counter() - ta
+    return {"bytes": tam_bytes, "tramos": n_tramos, "segundos": segundos,
+            "MB/s": tam_bytes / 1e6 / segundos}
+
+def _volcar_tramo(tramo: List[int], dir_tmp: str, i: int,
+                  binario: bool, umbral: int) -> str:
+    ord_rapida(tramo, umbral)
+    ruta = os.path.join(dir_tmp, f"tramo{i}")
+    with _abrir(ruta, "w", binario) as f:
+        for j in range(0, len(tramo), TAM_BLOQUE_ES):
+            _escribir_bloque(f, tramo[j:j + TAM_BLOQUE_ES], binario)
+    return ruta
+
+# ------------------------------
+# Selección (quickselect)
+# ------------------------------
+
+def seleccionar(v: List[int], k: int) -> int:
+    """
+    nth-element: reordena v (in place) de modo que v[k] sea el k-ésimo menor
+    (empezando en 0), con los menores a su izquierda. O(n) esperado.
+    """
+    if not 0 <= k < len(v):
+        raise IndexError("k fuera de rango")
+    izq, der = 0, len(v) - 1
+    while izq < der:
+        j = particion(v, izq, der)
+        if k == j:
+            break
+        if k < j:
+            der = j - 1
+        else:
+            izq = j + 1
+    return v[k]
+
+def menores_k(v: List[int], k: int) -> List[int]:
+    """
+    Top-k: devuelve ordenados los k menores de v (v queda reordenado).
+    """
+    if k <= 0:
+        return []
+    if k < len(v):
+        seleccionar(v, k - 1)
+    return ord_rapida(v[:k], 10)
+
+def percentiles(v: List[int], ps: List[float]) -> Dict[float, int]:
+    """
+    Calcula varios percentiles (0-100, rango más cercano) en una sola pasada
+    de selección múltiple: cada partición reparte los rangos pendientes
+    entre sus dos mitades, así que no se repite trabajo entre percentiles.
+    """
+    n = len(v)
+    if n == 0:
+        raise ValueError("vector vacío")
+    rango = {p: min(n - 1, max(0, round(p / 100 * (n - 1)))) for p in ps}
+    pila = [(0, n - 1, sorted(set(rango.values())))]
+    while pila:
+        izq, der, rs = pila.pop()
+        if not rs or izq >= der:
+            continue
+        j = particion(v, izq, der)
+        c = bisect_left(rs, j)
+        pila.append((izq, j - 1, rs[:c]))
+        pila.append((j + 1, der, rs[c + 1:] if c < len(rs) and rs[c] == j
+                     else rs[c:]))
+    return {p: v[r] for p, r in rango.items()}
+
 # ------------------------------
 # Generadores y utilidades
 # ------------------------------
 
 def aleatorio(size: int) -> List[int]:
-    return [random.randint(-size, size) for _ in range(size)]
+    # choices genera todo el vector de una vez (randint llama n veces)
+    return random.choices(range(-size, size + 1), k=size)
 
 def ascendente(size: int) -> List[int]:
     return list(range(1, size + 1))
@@ -80,23 +517,488 @@ def ascendente(size: int) -> List[int]:
 def descendente(size: int) -> List[int]:
     return list(range(size, 0, -1))
 
+def _desordenar(v: List[int], intercambios: int) -> List[int]:
+    n = len(v)
+    for _ in range(intercambios if n > 1 else 0):
+        i, j = random.randrange(n), random.randrange(n)
+        v[i], v[j] = v[j], v[i]
+    return v
+
+def casi_ascendente(size: int) -> List[int]:
+    # Ascendente con ~1% de pares intercambiados al azar
+    return _desordenar(ascendente(size), max(1, size // 100))
+
+def casi_descendente(size: int) -> List[int]:
+    return _desordenar(descendente(size), max(1, size // 100))
+
+def pocos_unicos(size: int) -> List[int]:
+    # Solo 16 valores distintos: muchos duplicados
+    return random.choices(range(16), k=size)
+
+def aleatorio_amplio(size: int) -> List[int]:
+    # Rango [-n², n²]: fuerza la rama de radix en ord_enteros
+    return random.choices(range(-size * size, size * size + 1), k=size)
+
 def microsegundos() -> int:
     return time.perf_counter_ns() // 1000
 
 def ordenado(v: List[int]) -> bool:
-    return all(v[i] >= v[i - 1] for i in range(1, len(v)))
+    # map(operator.le, ...) compara en C; sirve para listas y buffers
+    if np is not None and isinstance(v, np.ndarray):
+        return _ordenado_numpy(v)
+    return all(map(operator.le, v, islice(v, 1, None)))
+
+class Comparable:
+    """
+    Envoltorio de un entero que cuenta cada comparación que se hace con él.
+    Permite medir comparaciones sin tocar los algoritmos de ordenación.
+    """
+    comparaciones = 0
+
+    __slots__ = ("x",)
+
+    def __init__(self, x: int):
+        self.x = x
+
+    def __lt__(self, otro: "Comparable") -> bool:
+        Comparable.comparaciones += 1
+        return self.x < otro.x
+
+    def __gt__(self, otro: "Comparable") -> bool:
+        Comparable.comparaciones += 1
+        return self.x > otro.x
+
+    def __le__(self, otro: "Comparable") -> bool:
+        Comparable.comparaciones += 1
+        return self.x <= otro.x
+
+    def __ge__(self, otro: "Comparable") -> bool:
+        Comparable.comparaciones += 1
+        return self.x >= otro.x
+
+def contar_comparaciones(alg: Callable[[List[int]], List[int]],
+                         v: List[int]) -> int:
+    """
+    Ordena una copia envuelta de v con alg y devuelve las comparaciones hechas.
+    """
+    Comparable.comparaciones = 0
+    alg([Comparable(x) for x in v])
+    return Comparable.comparaciones
+
+# ------------------------------
+# Ordenación híbrida (elige motor según el grado de orden)
+# ------------------------------
+
+MOTORES: Dict[str, Callable[[List[int]], List[int]]] = {
+    "ord_insercion": ord_insercion,
+    "ord_shell": lambda v: ord_shell(v, seq_ciura(len(v) - 1)),
+    "ord_rapida": lambda v: ord_rapida(v, 10),
+    "ord_natural": ord_natural,
+    "ord_enteros": ord_enteros,
+}
+
+# Clase de entrada -> generador representativo para la calibración
+CLASES_ENTRADA: Dict[str, Callable[[int], List[int]]] = {
+    "casi_ascendente": casi_ascendente,
+    "casi_descendente": casi_descendente,
+    "pocos_unicos": pocos_unicos,
+    "aleatorio": aleatorio,
+}
+
+TAMAÑOS_CALIBRACION = (16, 64, 256, 1024, 4096, 16000)
+FICHERO_CRUCES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              "cruces_ordenacion.json")
+
+# Tabla por defecto (si no se ha calibrado): {clase: [[n_min, [motores]]]}
+CRUCES_POR_DEFECTO: Dict[str, List] = {
+    "casi_ascendente": [[0, ["ord_insercion", "ord_natural"]],
+                        [256, ["ord_natural", "ord_rapida"]]],
+    "casi_descendente": [[0, ["ord_natural", "ord_rapida"]]],
+    "pocos_unicos": [[0, ["ord_insercion", "ord_rapida"]],
+                     [64, ["ord_enteros", "ord_rapida"]]],
+    "aleatorio": [[0, ["ord_insercion", "ord_rapida"]],
+                  [64, ["ord_enteros", "ord_rapida"]]],
+}
+
+def medidas_orden(v: List[int], muestra: int = 256) -> Dict[str, float]:
+    """
+    Medidas baratas del grado de orden de v: tamaño, número de tramos
+    ascendentes, fracción estimada de inversiones (pares al azar) y
+    fracción de duplicados en una muestra.
+    """
+    n = len(v)
+    tramos = 1 + sum(map(operator.gt, v, islice(v, 1, None)))
+    pares = [sorted(random.sample(range(n), 2)) for _ in range(muestra)] \
+        if n > 1 else []
+    inversiones = (sum(v[i] > v[j] for i, j in pares) / len(pares)
+                   if pares else 0.0)
+    m = random.sample(v, min(n, muestra))
+    duplicados = 1 - len(set(m)) / len(m) if m else 0.0
+    return {"n": n, "tramos": tramos, "inversiones": inversiones,
+            "duplicados": duplicados}
+
+def clasificar_entrada(medidas: Dict[str, float]) -> str:
+    if medidas["duplicados"] > 0.5:
+        return "pocos_unicos"
+    if medidas["inversiones"] < 0.1:
+        return "casi_ascendente"
+    if medidas["inversiones"] > 0.9:
+        return "casi_descendente"
+    return "aleatorio"
+
+def cargar_cruces(ruta: str = FICHERO_CRUCES) -> Dict[str, List]:
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return CRUCES_POR_DEFECTO
+
+_cruces: Dict[str, List] | None = None
+
+def ordenar(v: List[int], cruces: Dict[str, List] | None = None) -> List[int]:
+    """
+    Punto de entrada único: mide el grado de orden de v y lo ordena (in
+    place) con el motor más rápido según la tabla de cruces calibrada.
+    """
+    global _cruces
+    if cruces is None:
+        if _cruces is None:
+            _cruces = cargar_cruces()
+        cruces = _cruces
+    medidas = medidas_orden(v)
+    if medidas["tramos"] == 1:
+        return v  # ya ordenado
+    filas = cruces[clasificar_entrada(medidas)]
+    motores = filas[0][1]
+    for n_min, ranking in filas:
+        if n_min <= medidas["n"]:
+            motores = ranking
+    enteros = all(type(x) is int for x in islice(v, 64))
+    for motor in motores:
+        if motor != "ord_enteros" or enteros:
+            return MOTORES[motor](v)
+    return MOTORES["ord_rapida"](v)
+
+def _tiempo_medio(alg: Callable[[List[int]], List[int]], v: List[int],
+                  minimo_s: float = 0.005) -> float:
+    # Repite hasta acumular minimo_s segundos; copias fuera del cronómetro
+    total, veces = 0.0, 0
+    while total < minimo_s:
+        w = v.copy()
+        ta = time.perf_counter()
+        alg(w)
+        total += time.perf_counter() - ta
+        veces += 1
+    return total / veces
+
+def calibrar_cruces(tamaños: Tuple[int, ...] = TAMAÑOS_CALIBRACION,
+                    ruta: str | None = FICHERO_CRUCES) -> Dict[str, List]:
+    """
+    Mide todos los motores en cada clase de entrada y tamaño, y guarda en
+    disco (JSON) el ranking por tamaño. Inserción se descarta en las clases
+    en que es cuadrática a partir de 1024 elementos.
+    """
+    global _cruces
+    cruces: Dict[str, List] = {}
+    for clase, generador in CLASES_ENTRADA.items():
+        filas = []
+        for n in tamaños:
+            v = generador(n)
+            tiempos = {}
+            for nombre, motor in MOTORES.items():
+                if (nombre == "ord_insercion" and n > 1024
+                        and clase != "casi_ascendente"):
+                    continue
+                tiempos[nombre] = _tiempo_medio(motor, v)
+            ranking = sorted(tiempos, key=tiempos.get)
+            print(f"{clase:>18} {n:8d}  " +
+                  "  ".join(f"{m}={tiempos[m] * 1e6:.1f}µs" for m in ranking))
+            if not filas or filas[-1][1] != ranking[:2]:
+                filas.append([0 if not filas else n, ranking[:2]])
+        cruces[clase] = filas
+    if ruta is not None:
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump(cruces, f, indent=2)
+    _cruces = cruces
+    return cruces
+
+# ------------------------------
+# Buffers tipados (int64, 8 bytes por elemento)
+# ------------------------------
+
+BACKENDS = ("list", "array", "memoryview") + (("numpy",) if np else ())
+
+def a_buffer(v: Sequence[int], backend: str = "array"):
+    """
+    Copia v al backend pedido: "list", "array" (array('q')),
+    "memoryview" (vista 'q' sobre un array) o "numpy" (int64).
+    """
+    if backend == "list":
+        return list(v)
+    if backend == "array":
+        return array("q", v)
+    if backend == "memoryview":
+        return memoryview(array("q", v))
+    if backend == "numpy":
+        if np is None:
+            raise ValueError("NumPy no está instalado")
+        return np.array(v, dtype=np.int64)
+    raise ValueError(f"Backend desconocido: {backend}")
+
+def bytes_por_elemento(v) -> float:
+    """
+    Memoria por elemento: en listas cuenta el puntero y cada int en caja.
+    """
+    n = max(1, len(v))
+    if isinstance(v, list):
+        return (sys.getsizeof(v) + sum(map(sys.getsizeof, v))) / n
+    if isinstance(v, memoryview):
+        return v.nbytes / n
+    if np is not None and isinstance(v, np.ndarray):
+        return v.nbytes / n
+    return sys.getsizeof(v) / n
+
+# ------------------------------
+# Generadores de entradas (con semilla y en bloque)
+# ------------------------------
+
+def _gen_aleatorio(rng: random.Random, size: int) -> List[int]:
+    return rng.choices(range(-size, size + 1), k=size)
+
+def _gen_ascendente(rng: random.Random, size: int) -> List[int]:
+    return list(range(1, size + 1))
+
+def _gen_descendente(rng: random.Random, size: int) -> List[int]:
+    return list(range(size, 0, -1))
+
+def _gen_casi_ordenado(rng: random.Random, size: int,
+                       k: int | None = None) -> List[int]:
+    # Ascendente con k intercambios al azar (por defecto ~1% de n)
+    v = list(range(1, size + 1))
+    if size > 1:
+        k = max(1, size // 100) if k is None else k
+        for i, j in zip(rng.choices(range(size), k=k),
+                        rng.choices(range(size), k=k)):
+            v[i], v[j] = v[j], v[i]
+    return v
+
+def _gen_pocos_unicos(rng: random.Random, size: int,
+                      distintos: int = 16) -> List[int]:
+    return rng.choices(range(distintos), k=size)
+
+def _gen_organo(rng: random.Random, size: int) -> List[int]:
+    # Tubos de órgano: 1, 2, ..., n/2, ..., 2, 1
+    mitad = (size + 1) // 2
+    return list(range(1, mitad + 1)) + list(range(size - mitad, 0, -1))
+
+def _gen_sierra(rng: random.Random, size: int,
+                dientes: int = 8) -> List[int]:
+    # Dientes de sierra: tramos ascendentes repetidos
+    paso = max(1, -(-size // dientes))
+    return [i % paso for i in range(size)]
+
+def _gen_zipf(rng: random.Random, size: int, s: float = 1.1) -> List[int]:
+    # Valor k con probabilidad proporcional a 1/k^s, k en [1, n]
+    if size == 0:
+        return []
+    acumulados = list(accumulate(k ** -s for k in range(1, size + 1)))
+    return rng.choices(range(1, size + 1), cum_weights=acumulados, k=size)
+
+@contextmanager
+def limite_recursion(minimo: int):
+    """
+    Amplía el límite de recursión a al menos minimo mientras dura el
+    bloque y restaura el anterior al salir.
+    """
+    anterior = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(anterior, minimo))
+    try:
+        yield
+    finally:
+        sys.setrecursionlimit(anterior)
+
+def _gen_adversario(rng: random.Random, size: int) -> List[int]:
+    """
+    Entrada adversaria de McIlroy contra ord_rapida (mediana3): se ordenan
+    índices cuyos valores se fijan en cada comparación para forzar
+    particiones lo más desequilibradas posible. El caso peor es O(n²) y
+    con profundidad de recursión O(n): ordenar el resultado con ord_rapida
+    exige ampliar el límite con limite_recursion(2 * size + 1000).
+    """
+    gas = size
+    val = [gas] * size
+    estado = [0, 0]  # [candidato, siguiente valor sólido]
+
+    def congelar(i: int) -> None:
+        val[i] = estado[1]
+        estado[1] += 1
+
+    def cmp(x: int, y: int) -> int:
+        if val[x] == gas and val[y] == gas:
+            congelar(x if x == estado[0] else y)
+        if val[x] == gas:
+            estado[0] = x
+        elif val[y] == gas:
+            estado[0] = y
+        return val[x] - val[y]
+
+    class Gas:
+        __slots__ = ("i",)
+
+        def __init__(self, i: int):
+            self.i = i
+
+        def __lt__(self, otro: "Gas") -> bool:
+            return cmp(self.i, otro.i) < 0
+
+        def __gt__(self, otro: "Gas") -> bool:
+            return cmp(self.i, otro.i) > 0
+
+    with limite_recursion(2 * size + 1000):
+        ord_rapida([Gas(i) for i in range(size)], 1)
+    for i in range(size):
+        if val[i] == gas:
+            congelar(i)
+    return val
+
+GENERADORES: Dict[str, Callable[..., List[int]]] = {
+    "aleatorio": _gen_aleatorio,
+    "ascendente": _gen_ascendente,
+    "descendente": _gen_descendente,
+    "casi_ordenado": _gen_casi_ordenado,
+    "pocos_unicos": _gen_pocos_unicos,
+    "organo": _gen_organo,
+    "sierra": _gen_sierra,
+    "zipf": _gen_zipf,
+    "adversario": _gen_adversario,
+}
+
+def generar(distribucion: str, size: int, semilla: int | None = None,
+            backend: str = "list", **params):
+    """
+    Genera una entrada de la distribución pedida (ver GENERADORES) con un
+    generador propio sembrado con semilla, y la devuelve en el backend
+    indicado ("list", "array", "memoryview" o "numpy"). Los valores se
+    sacan en bloque (choices) y no con una llamada a randint por elemento.
+    """
+    if distribucion not in GENERADORES:
+        raise ValueError(f"Distribución desconocida: {distribucion}")
+    if (backend == "numpy" and np is not None and not params
+            and distribucion in ("aleatorio", "pocos_unicos")):
+        rng_np = np.random.default_rng(semilla)
+        if distribucion == "aleatorio":
+            return rng_np.integers(-size, size + 1, size, dtype=np.int64)
+        return rng_np.integers(0, 16, size, dtype=np.int64)
+    v = GENERADORES[distribucion](random.Random(semilla), size, **params)
+    return v if backend == "list" else a_buffer(v, backend)
+
+def generador(distribucion: str, semilla: int | None = None,
+              **params) -> Callable[[int], List[int]]:
+    """
+    Adapta generar() a la firma gen(n) que usan medir_tiempo_ejecucion y
+    compañía. Con semilla, cada llamada devuelve la misma entrada para n.
+    """
+    def gen(size: int) -> List[int]:
+        return generar(distribucion, size, semilla, **params)
+    gen.__name__ = distribucion
+    return gen
+
+# ------------------------------
+# Verificación de resultados (orden + misma multiconjunto)
+# ------------------------------
+
+# Con verificar=True en medir_tiempo_ejecucion (solo algoritmos de
+# ordenación) se verifica tras cada medición de una sola ejecución
+# (t >= 1000 µs), fuera del cronómetro.
+VERIFICAR_SALIDAS = True
+BLOQUE_VERIFICACION = 1 << 20
+_SALES = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F)
+_MASCARA64 = (1 << 64) - 1
+
+def _ordenado_numpy(v) -> bool:
+    # Por bloques solapados en un elemento para no duplicar memoria
+    for i in range(0, len(v) - 1, BLOQUE_VERIFICACION):
+        bloque = v[i:i + BLOQUE_VERIFICACION + 1]
+        if not bool(np.all(bloque[1:] >= bloque[:-1])):
+            return False
+    return True
+
+def _mezcla64_numpy(x, sal: int):
+    # splitmix64 vectorizado (aritmética módulo 2^64)
+    z = x.astype(np.uint64) + np.uint64(sal)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+def _huella_python(v) -> Tuple[int, ...]:
+    # Las dos mezclas splitmix64 (sobre los 64 bits de cada valor) en una
+    # sola pasada, con la aritmética en línea: ~1 µs por elemento
+    m, c1, c2 = _MASCARA64, 0xBF58476D1CE4E5B9, 0x94D049BB133111EB
+    sal0, sal1 = _SALES
+    suma0 = suma1 = 0
+    for x in v:
+        x &= m
+        z = (x + sal0) & m
+        z = ((z ^ (z >> 30)) * c1) & m
+        z = ((z ^ (z >> 27)) * c2) & m
+        suma0 += z ^ (z >> 31)
+        z = (x + sal1) & m
+        z = ((z ^ (z >> 30)) * c1) & m
+        z = ((z ^ (z >> 27)) * c2) & m
+        suma1 += z ^ (z >> 31)
+    return len(v), suma0 & m, suma1 & m
+
+def huella(v) -> Tuple[int, ...]:
+    """
+    Huella de multiconjunto de v, independiente del orden: número de
+    elementos y sumas (mod 2^64) de dos mezclas splitmix64 de cada valor.
+    Se recorre v una vez, sin copiarlo ni ordenarlo, y da lo mismo para
+    los mismos valores en cualquier backend. Con NumPy, arrays de NumPy,
+    array('q') y memoryview se procesan vectorizados por bloques
+    (np.frombuffer no copia); sin NumPy, o con listas, es un bucle O(n)
+    en Python puro, unas 4 veces más lento que sorted(v).
+    """
+    if np is not None and isinstance(v, (array, memoryview)):
+        formato = v.typecode if isinstance(v, array) else v.format
+        if formato == "q":
+            v = np.frombuffer(v, dtype=np.int64)
+    if np is not None and isinstance(v, np.ndarray):
+        sumas = [0, 0]
+        with np.errstate(over="ignore"):
+            for i in range(0, len(v), BLOQUE_VERIFICACION):
+                bloque = v[i:i + BLOQUE_VERIFICACION]
+                for k, sal in enumerate(_SALES):
+                    sumas[k] = (sumas[k] + int(_mezcla64_numpy(bloque, sal)
+                                                .sum(dtype=np.uint64))) \
+                        & _MASCARA64
+        return (len(v), *sumas)
+    # hash() no sirve: hash(-1) == hash(-2) y reduce módulo 2^61 - 1
+    return _huella_python(v)
+
+def verificar(huella_entrada: Tuple[int, ...], salida) -> bool:
+    """
+    True si salida está ordenada y es una permutación de la entrada
+    (misma huella de multiconjunto).
+    """
+    return ordenado(salida) and huella(salida) == huella_entrada
 
 # ------------------------------
 # Medición de tiempos (compacta)
 # ------------------------------
 
 def _tiempo_corregido(alg: Callable[[List[int]], List[int]],
-                      gen: Callable[[int], List[int]], n: int) -> float:
+                      gen: Callable[[int], List[int]], n: int,
+                      verificar_salida: bool = False) -> float:
+    v = gen(n)  # la generación queda fuera de la medición
+    h = huella(v) if verificar_salida and VERIFICAR_SALIDAS else None
     ta = microsegundos()
-    alg(gen(n))
+    salida = alg(v)
     td = microsegundos()
     t = td - ta
     if t >= 1000:
+        if h is not None and not verificar(h, salida):
+            raise RuntimeError(f"Salida incorrecta para n={n}: no está "
+                               "ordenada o no es permutación de la entrada.")
         return float(t), " "
     # Corrección por repeticiones K y resta del generador
     K = 1000
@@ -115,14 +1017,18 @@ def _tiempo_corregido(alg: Callable[[List[int]], List[int]],
 def medir_tiempo_ejecucion(alg: Callable[[List[int]], List[int]],
                            gen_vector: Callable[[int], List[int]],
                            muestra_inicial: int,
-                           muestras: int, factor: int = 2) -> Dict[int, Tuple[float, str]]:
+                           muestras: int, factor: int = 2,
+                           verificar: bool = False) -> Dict[int, Tuple[float, str]]:
     """
     Devuelve {n: (tiempo_µs, marca)} con corrección si t<1000 µs.
+    Con verificar=True alg debe ordenar: se comprueba que su salida está
+    ordenada y es permutación de la entrada.
     """
     res: Dict[int, Tuple[float, str]] = {}
     n = muestra_inicial
     for _ in range(muestras):
-        t, m = _tiempo_corregido(lambda v: alg(v.copy()), gen_vector, n)
+        t, m = _tiempo_corregido(lambda v: alg(v.copy()), gen_vector, n,
+                                 verificar)
         if t < 0:
             raise RuntimeError("Cronómetro interno no fiable.")
         res[n] = (t, m)
@@ -201,16 +1107,23 @@ def Test_quicksort(ord_rapida_fun: Callable[[List[int], int], List[int]],
                    gen_vector: Callable[[int], List[int]],
                    size_vector: int, umbral: int) -> bool:
     """
-    Valida Quicksort imprimiendo entrada/salida y comprobando orden.
+    Valida Quicksort comprobando orden y que la salida es permutación de
+    la entrada. Los vectores solo se imprimen si son pequeños.
     """
-    print(f"Validación QuickSort (umbral={umbral}) con tamaño {size_vector}:")
+    print(f"Validación {ord_rapida_fun.__name__} (umbral={umbral}) "
+          f"con tamaño {size_vector}:")
     v = gen_vector(size_vector)
-    print("Vector inicial:\n", v)
+    h = huella(v)
+    if size_vector <= 20:
+        print("Vector inicial:\n", v)
     resultado = ord_rapida_fun(v.copy(), umbral)
-    print("Resultado ordenado:\n", resultado)
+    if size_vector <= 20:
+        print("Resultado ordenado:\n", resultado)
     ok = ordenado(resultado)
-    print("Ordenado?", ok, "\n")
-    return ok
+    print("Ordenado?", ok)
+    permutacion = huella(resultado) == h
+    print("Permutación de la entrada?", permutacion, "\n")
+    return ok and permutacion
 
 def experimento_completo(muestra_inicial: int = 500,
                          muestras: int = 6, factor: int = 2):
@@ -227,10 +1140,211 @@ def experimento_completo(muestra_inicial: int = 500,
             print(f"\n=== Mediciones Quicksort - caso: {nombre_caso} - UMBRAL={umbral} ===")
             resultados = medir_tiempo_ejecucion(
                 lambda vec, u=umbral: ord_rapida(vec, u),
-                generador, muestra_inicial, muestras, factor)
+                generador, muestra_inicial, muestras, factor, verificar=True)
             mostrar_tiempo_rapida("ord_rapida", resultados,
                                   f"{nombre_caso} (umbral={umbral})")
 
+def comparar_rapida_dual(muestra_inicial: int = 500,
+                         muestras: int = 6, factor: int = 2,
+                         umbral: int = 10):
+    """
+    Compara ord_rapida y ord_rapida_dual en los tres casos: tablas de
+    tiempos y número de comparaciones entre elementos para cada n.
+    """
+    casos = [("ascendente", ascendente),
+             ("descendente", descendente),
+             ("aleatorio", aleatorio)]
+    algoritmos = [("ord_rapida", ord_rapida),
+                  ("ord_rapida_dual", ord_rapida_dual)]
+    for nombre_caso, generador in casos:
+        for nombre_alg, alg in algoritmos:
+            print(f"\n=== Mediciones {nombre_alg} - caso: {nombre_caso} "
+                  f"- UMBRAL={umbral} ===")
+            resultados = medir_tiempo_ejecucion(
+                lambda vec, f=alg: f(vec, umbral),
+                generador, muestra_inicial, muestras, factor, verificar=True)
+            mostrar_tiempo_rapida(nombre_alg, resultados,
+                                  f"{nombre_caso} (umbral={umbral})")
+
+        print(f"**Comparaciones - caso: {nombre_caso} | umbral={umbral}**")
+        print(f"{'n[-]':>8} {'ord_rapida':>14} {'ord_rapida_dual':>16}"
+              f" {'dual/simple':>12}")
+        n = muestra_inicial
+        for _ in range(muestras):
+            v = generador(n)
+            c1 = contar_comparaciones(lambda w: ord_rapida(w, umbral), v)
+            c2 = contar_comparaciones(lambda w: ord_rapida_dual(w, umbral), v)
+            print(f"{n:8d} {c1:14d} {c2:16d} {c2 / c1:12.3f}")
+            n *= factor
+        print()
+
+def comparar_seleccion(muestra_inicial: int = 500,
+                       muestras: int = 6, factor: int = 2):
+    """
+    Compara ordenar entero (ord_rapida) frente a seleccionar la mediana,
+    los 10 menores y los percentiles 50/90/99 sobre vectores aleatorios.
+    """
+    ops = [("ord_rapida", lambda v: ord_rapida(v, 10)),
+           ("mediana", lambda v: seleccionar(v, len(v) // 2)),
+           ("top-10", lambda v: menores_k(v, 10)),
+           ("p50/p90/p99", lambda v: percentiles(v, [50, 90, 99]))]
+    tiempos = {nombre: medir_tiempo_ejecucion(op, aleatorio, muestra_inicial,
+                                              muestras, factor)
+               for nombre, op in ops}
+    print("\n**Selección frente a ordenación completa - caso: aleatorio**")
+    print(f"{'n[-]':>8}" + "".join(f"{nombre + '[µs]':>18}"
+                                   for nombre, _ in ops))
+    for n in tiempos["ord_rapida"]:
+        fila = ""
+        for nombre, _ in ops:
+            t_n, signo = tiempos[nombre][n]
+            fila += f"{signo:>4}{t_n:14.3f}"
+        print(f"{n:8d}{fila}")
+    print("\nNota: Si (*) -> 't(n)<1000': tiempo promedio de K=1000 ejecuciones.\n")
+
+def experimento_enteros(muestra_inicial: int = 500,
+                        muestras: int = 6, factor: int = 2):
+    """
+    Mide ord_enteros en los tres casos y con rango amplio (radix).
+    Al ser O(n + k) con k proporcional a n, la columna t(n)/n debe
+    mantenerse aproximadamente constante.
+    """
+    casos = [("ascendente", ascendente),
+             ("descendente", descendente),
+             ("aleatorio", aleatorio),
+             ("aleatorio_amplio", aleatorio_amplio)]
+    for nombre_caso, generador in casos:
+        print(f"\n=== Mediciones ord_enteros - caso: {nombre_caso} ===")
+        resultados = medir_tiempo_ejecucion(ord_enteros, generador,
+                                            muestra_inicial, muestras, factor,
+                                            verificar=True)
+        mostrar_tiempo_rapida("ord_enteros", resultados, nombre_caso)
+
+def experimento_externo(tamaños_mb: Tuple[int, ...] = (1, 4, 16),
+                        max_elementos: int = 1 << 18, binario: bool = True):
+    """
+    Ordena ficheros aleatorios de tamaño creciente con ordenar_externo y
+    muestra el rendimiento en MB/s. Con max_elementos fijo, los ficheros
+    mayores que el tramo se comportan como si no cupieran en memoria.
+    """
+    print(f"\n**Ordenación externa ({'binario' if binario else 'texto'}, "
+          f"tramo={max_elementos} elementos)**")
+    print(f"{'MB':>8} {'n[-]':>10} {'tramos':>8} {'t[s]':>10}"
+          f" {'MB/s':>10} {'Ordenado?':>10}")
+    with tempfile.TemporaryDirectory() as dir_tmp:
+        entrada = os.path.join(dir_tmp, "entrada")
+        salida = os.path.join(dir_tmp, "salida")
+        for mb in tamaños_mb:
+            n = mb * 10**6 // 8
+            with _abrir(entrada, "w", binario) as f:
+                for j in range(0, n, TAM_BLOQUE_ES):
+                    m = min(TAM_BLOQUE_ES, n - j)
+                    _escribir_bloque(f, [random.randint(-n, n)
+                                         for _ in range(m)], binario)
+            res = ordenar_externo(entrada, salida, binario, max_elementos)
+            anterior, ok = None, True
+            for x in _leer_tramo(salida, binario):
+                if anterior is not None and x < anterior:
+                    ok = False
+                    break
+                anterior = x
+            print(f"{res['bytes'] / 1e6:8.2f} {n:10d} {res['tramos']:8d}"
+                  f" {res['segundos']:10.3f} {res['MB/s']:10.3f} {str(ok):>10}")
+    print()
+
+def comparar_natural(muestra_inicial: int = 500,
+                     muestras: int = 6, factor: int = 2):
+    """
+    Compara ord_natural con ord_rapida (umbral=10) en los casos clásicos y
+    en los casi ordenados. ord_insercion solo se mide en los casos
+    ascendentes: en los demás es cuadrática y no aporta nada.
+    """
+    casos = [("ascendente", ascendente),
+             ("descendente", descendente),
+             ("aleatorio", aleatorio),
+             ("casi_ascendente", casi_ascendente),
+             ("casi_descendente", casi_descendente)]
+    for nombre_caso, generador in casos:
+        algoritmos = [("ord_natural", ord_natural),
+                      ("ord_rapida", lambda vec: ord_rapida(vec, 10))]
+        if nombre_caso in ("ascendente", "casi_ascendente"):
+            algoritmos.append(("ord_insercion", ord_insercion))
+        for nombre_alg, alg in algoritmos:
+            print(f"\n=== Mediciones {nombre_alg} - caso: {nombre_caso} ===")
+            resultados = medir_tiempo_ejecucion(alg, generador,
+                                                muestra_inicial, muestras,
+                                                factor, verificar=True)
+            mostrar_tiempo_rapida(nombre_alg, resultados, nombre_caso)
+
+def comparar_ordenar(muestra_inicial: int = 500,
+                     muestras: int = 6, factor: int = 2):
+    """
+    Calibra la tabla de cruces y mide ordenar() en todas las clases.
+    """
+    print("\n**Calibración de cruces (t medio por motor, más rápido primero)**")
+    calibrar_cruces()
+    for nombre_caso, generador in [("ascendente", ascendente),
+                                   ("descendente", descendente)] + \
+            list(CLASES_ENTRADA.items()):
+        print(f"\n=== Mediciones ordenar - caso: {nombre_caso} ===")
+        resultados = medir_tiempo_ejecucion(ordenar, generador,
+                                            muestra_inicial, muestras, factor,
+                                            verificar=True)
+        mostrar_tiempo_rapida("ordenar", resultados, nombre_caso)
+
+def experimento_buffers(tamaños: Tuple[int, ...] = (160000, 640000, 1600000)):
+    """
+    Compara listas con buffers tipados a 10-100 veces el tamaño máximo de
+    los demás experimentos: bytes por elemento y tiempo de ord_rapida y
+    ord_shell (aleatorio) y de ord_insercion (ascendente, su caso lineal;
+    en los demás es cuadrática).
+    """
+    algoritmos = [("ord_rapida", lambda w: ord_rapida(w, 10), aleatorio),
+                  ("ord_shell", lambda w: ord_shell(w, seq_ciura(len(w) - 1)),
+                   aleatorio),
+                  ("ord_insercion", ord_insercion, ascendente)]
+    print("\n**Backends de almacenamiento (t en ms, memoria en bytes/elemento)**")
+    print(f"{'n[-]':>8} {'backend':>11} {'B/elem':>8}" +
+          "".join(f"{nombre + '[ms]':>18}" for nombre, _, _ in algoritmos))
+    for n in tamaños:
+        entradas = {gen: gen(n) for _, _, gen in algoritmos}
+        for backend in BACKENDS:
+            fila = ""
+            for _, alg, gen in algoritmos:
+                w = a_buffer(entradas[gen], backend)
+                ta = time.perf_counter()
+                alg(w)
+                t = time.perf_counter() - ta
+                if not ordenado(w):
+                    raise RuntimeError(f"{backend}: resultado no ordenado")
+                fila += f"{t * 1e3:18.1f}"
+            memoria = bytes_por_elemento(a_buffer(entradas[aleatorio], backend))
+            print(f"{n:8d} {backend:>11} {memoria:8.1f}{fila}")
+    print()
+
+def experimento_distribuciones(muestra_inicial: int = 500,
+                               muestras: int = 6, factor: int = 2,
+                               semilla: int = 1):
+    """
+    Mide ord_rapida (umbral=10) sobre todas las distribuciones de
+    GENERADORES. La adversaria es cuadrática, así que solo se mide hasta
+    4000 elementos.
+    """
+    for distribucion in GENERADORES:
+        m = muestras
+        if distribucion == "adversario":
+            m = min(muestras, max(1, int(math.log(4000 / muestra_inicial,
+                                                   factor)) + 1))
+        n_max = muestra_inicial * factor ** (m - 1)
+        print(f"\n=== Mediciones ord_rapida - caso: {distribucion} ===")
+        # La adversaria lleva la recursión de ord_rapida a profundidad O(n)
+        with limite_recursion(2 * n_max + 1000):
+            resultados = medir_tiempo_ejecucion(
+                lambda vec: ord_rapida(vec, 10),
+                generador(distribucion, semilla), muestra_inicial, m, factor,
+                verificar=True)
+        mostrar_tiempo_rapida("ord_rapida", resultados, distribucion)
+
 # ------------------------------
 # Bloque principal
 # ------------------------------
@@ -242,7 +1356,21 @@ if __name__ == "__main__":
         print("Error en la implementación de Quicksort (umbral=1). Revise el código.")
     else:
         print("Validación correcta.\n")
+    ok = Test_quicksort(ord_rapida_dual, aleatorio, 11, umbral=1)
+    if not ok:
+        print("Error en la implementación de Quicksort dual (umbral=1).")
+    ok = Test_quicksort(ord_rapida, aleatorio, 1000000, umbral=10)
+    if not ok:
+        print("Error en la implementación de Quicksort a gran escala.")
 
     muestra_inicial, muestras, factor = 500, 6, 2
     experimento_completo(muestra_inicial, muestras, factor)
+    comparar_rapida_dual(muestra_inicial, muestras, factor)
+    comparar_seleccion(muestra_inicial, muestras, factor)
+    experimento_enteros(muestra_inicial, muestras, factor)
+    experimento_externo()
+    comparar_natural(muestra_inicial, muestras, factor)
+    comparar_ordenar(muestra_inicial, muestras, factor)
+    experimento_buffers()
+    experimento_distribuciones(muestra_inicial, muestras, factor)
     print("\n--- FIN MEDICIONES PRÁCTICA 3 ---")
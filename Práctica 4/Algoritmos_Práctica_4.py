@@ -1,6 +1,20 @@
-from collections.abc import Callable
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator
+from array import array
+from itertools import accumulate
+from operator import lshift
+import asyncio
+import bisect
+import math
+import json
+import mmap
+import os
 import random
+import struct
+import sys
+import tempfile
 import time
+import tracemalloc
 
 # Como estas cte's no dependen de ninguna funcion pueden definirse
 # Aqui en contraposicion con CONFIGURACION que para el momento en que
@@ -8,6 +22,32 @@ import time
 # guarda como referencia.
 TAM_CERRADA = 38197
 TAM_ABIERTA = 19069
+# Casillas del array antiguo que se trasladan en cada operación
+# mientras dura un redimensionado incremental.
+PASOS_REHASH = 8
+# Fracción de casillas borradas (lápidas) a partir de la cual la tabla
+# cerrada se compacta: rehash al mismo tamaño que elimina las lápidas.
+MAX_BORRADAS = 0.2
+# Entradas que la carga en flujo acumula antes de pasarlas a insertar_lote
+TAM_LOTE_FLUJO = 4096
+
+def es_primo(n: int) -> bool:
+    if n < 2:
+        return False
+    if n % 2 == 0:
+        return n == 2
+    i = 3
+    while i * i <= n:
+        if n % i == 0:
+            return False
+        i += 2
+    return True
+
+def siguiente_primo(n: int) -> int:
+    # Los tamaños primos mantienen las secuencias de exploración útiles
+    while not es_primo(n):
+        n += 1
+    return n
 
 #Importación de datos
 def leer_sinonimos(nombre="sinonimos.txt"):
@@ -18,6 +58,66 @@ def leer_sinonimos(nombre="sinonimos.txt"):
             datos.append((clave, sinonimos))
     return datos#Lista de 19062 tuplas (clave, sinonimos)
 
+def leer_sinonimos_flujo(nombre="sinonimos.txt", internar : bool = True
+                         ) -> Iterator[tuple[str, bytes]]:
+    """
+    Generador: da (clave, sinónimos en UTF-8) línea a línea sin cargar
+    el fichero. Las claves se internan (sys.intern) si internar y los
+    sinónimos no se decodifican.
+    """
+    with open(nombre, "rb") as f:
+        for linea in f:
+            clave, sinonimos = linea.rstrip(b"\r\n").split(b"\t", 1)
+            clave = clave.decode("utf-8")
+            yield (sys.intern(clave) if internar else clave), sinonimos
+
+#Diccionario con los sinónimos en un único buffer compartido: la tabla
+# guarda en lugar de cada cadena el número de entrada (un int pequeño) y
+# los sinónimos de la entrada i son buffer[limites[i]:limites[i + 1]].
+# Solo se decodifican y separan cuando una búsqueda los pide.
+class DiccionarioPerezoso:
+    def __init__(self, tabla):
+        self.tabla = tabla
+        self.buffer = bytearray()
+        self.limites = array("Q", [0])
+
+    def cargar(self, nombre="sinonimos.txt",
+               tam_lote : int = TAM_LOTE_FLUJO,
+               internar : bool = True) -> int:
+        """
+        Lee el fichero en flujo y lo va insertando en la tabla por lotes
+        de tam_lote entradas. Devuelve las colisiones totales.
+        """
+        colisiones = 0
+        lote = []
+        for clave, sinonimos in leer_sinonimos_flujo(nombre, internar):
+            self.buffer.extend(sinonimos)
+            self.limites.append(len(self.buffer))
+            lote.append((clave, len(self.limites) - 2))
+            if len(lote) == tam_lote:
+                colisiones += self.tabla.insertar_lote(lote)
+                lote.clear()
+        if lote:
+            colisiones += self.tabla.insertar_lote(lote)
+        return colisiones
+
+    def texto(self, entrada : int) -> str:
+        return self.buffer[self.limites[entrada]:
+                           self.limites[entrada + 1]].decode("utf-8")
+
+    def buscar_texto(self, clave : str) -> tuple[str | None, int]:
+        # Como buscar() de las tablas: los sinónimos en una sola cadena
+        entrada, colisiones = self.tabla.buscar(clave)
+        if entrada is None:
+            return None, colisiones
+        return self.texto(entrada), colisiones
+
+    def buscar(self, clave : str) -> tuple[list[str] | None, int]:
+        entrada, colisiones = self.tabla.buscar(clave)
+        if entrada is None:
+            return None, colisiones
+        return [s.strip() for s in self.texto(entrada).split(",")], colisiones
+
 #Funciones de dispersión A y B
 def dispersionA(clave : str, tamTabla : int) -> int:
     n = min(8, len(clave))
@@ -35,6 +135,113 @@ def dispersionB(clave : str, tamTabla : int) -> int:
         valor = ((valor * 32) + ord(clave[i]))
     return valor % tamTabla
 
+#Funciones de dispersión sobre la clave completa. A y B solo miran los 8
+# primeros caracteres (y A además suma, así que los anagramas colisionan).
+MASCARA_64 = (1 << 64) - 1
+FNV_OFFSET = 0xcbf29ce484222325
+FNV_PRIMO = 0x100000001b3
+# Polinómica: valor = sum(c_i * BASE^(n-1-i)) mod PRIMO (primo de Mersenne)
+BASE_POLINOMICA = 131
+PRIMO_POLINOMICO = (1 << 61) - 1
+# Clave de 128 bits por defecto de la dispersión SipHash
+SEMILLA_SIPHASH = (0x0706050403020100, 0x0f0e0d0c0b0a0908)
+
+def dispersionFNV(clave : str, tamTabla : int) -> int:
+    # FNV-1a de 64 bits sobre los bytes UTF-8 de la clave
+    valor = FNV_OFFSET
+    for byte in clave.encode("utf-8"):
+        valor = ((valor ^ byte) * FNV_PRIMO) & MASCARA_64
+    return valor % tamTabla
+
+def dispersionPolinomica(clave : str, tamTabla : int) -> int:
+    valor = 0
+    for c in clave:
+        valor = (valor * BASE_POLINOMICA + ord(c)) % PRIMO_POLINOMICO
+    return valor % tamTabla
+
+def _rotl64(x : int, b : int) -> int:
+    return ((x << b) | (x >> (64 - b))) & MASCARA_64
+
+def siphash(k0 : int, k1 : int, datos : bytes) -> int:
+    """SipHash-2-4 de datos con la clave de 128 bits (k0, k1)."""
+    v0 = k0 ^ 0x736f6d6570736575
+    v1 = k1 ^ 0x646f72616e646f6d
+    v2 = k0 ^ 0x6c7967656e657261
+    v3 = k1 ^ 0x7465646279746573
+    n = len(datos)
+    fin = n - n % 8
+    # Bloques de 8 bytes y un último bloque con el resto y la longitud
+    bloques = [int.from_bytes(datos[i:i + 8], "little")
+               for i in range(0, fin, 8)]
+    bloques.append(((n & 0xff) << 56) | int.from_bytes(datos[fin:], "little"))
+    for rondas, m in [(2, m) for m in bloques] + [(4, None)]:
+        if m is None:
+            v2 ^= 0xff
+        else:
+            v3 ^= m
+        for _ in range(rondas):
+            v0 = (v0 + v1) & MASCARA_64
+            v1 = _rotl64(v1, 13) ^ v0
+            v0 = _rotl64(v0, 32)
+            v2 = (v2 + v3) & MASCARA_64
+            v3 = _rotl64(v3, 16) ^ v2
+            v0 = (v0 + v3) & MASCARA_64
+            v3 = _rotl64(v3, 21) ^ v0
+            v2 = (v2 + v1) & MASCARA_64
+            v1 = _rotl64(v1, 17) ^ v2
+            v2 = _rotl64(v2, 32)
+        if m is not None:
+            v0 ^= m
+    return v0 ^ v1 ^ v2 ^ v3
+
+def dispersion_siphash(k0 : int, k1 : int) -> Callable[[str, int], int]:
+    """
+    Función de dispersión SipHash con semilla (k0, k1). Con una semilla
+    secreta nadie puede preparar claves que colisionen a propósito.
+    """
+    def dispersionSipHash(clave : str, tamTabla : int) -> int:
+        return siphash(k0, k1, clave.encode("utf-8")) % tamTabla
+    return dispersionSipHash
+
+dispersionSipHash = dispersion_siphash(*SEMILLA_SIPHASH)
+
+#Dispersión por lotes: las mismas funciones aplicadas a muchas claves a la
+# vez, con map() sobre los caracteres en lugar de un bucle con ord().
+# B desplaza 5 bits por carácter: el carácter i de n suma ord << 5*(n-1-i).
+DESPLAZAMIENTOS_B = (35, 30, 25, 20, 15, 10, 5, 0)
+
+def dispersionA_lote(claves : list[str], tamTabla : int) -> list[int]:
+    return [sum(map(ord, clave[:8])) % tamTabla for clave in claves]
+
+def dispersionB_lote(claves : list[str], tamTabla : int) -> list[int]:
+    # map() se detiene en el iterable más corto: con 8 desplazamientos
+    # solo entran los 8 primeros caracteres de las claves largas.
+    return [sum(map(lshift, map(ord, clave),
+                    DESPLAZAMIENTOS_B[-len(clave):] if len(clave) < 8
+                    else DESPLAZAMIENTOS_B)) % tamTabla
+            for clave in claves]
+
+DISPERSIONES_LOTE = {
+    dispersionA: dispersionA_lote,
+    dispersionB: dispersionB_lote,
+}
+
+def dispersar_lote(dispersion : Callable[[str, int], int],
+                   claves : list[str], tamTabla : int) -> list[int]:
+    """Posición inicial de cada clave, con la versión por lotes si la hay."""
+    lote = DISPERSIONES_LOTE.get(dispersion)
+    if lote is not None:
+        return lote(claves, tamTabla)
+    return [dispersion(clave, tamTabla) for clave in claves]
+
+def tam_presizado(tam : int, n : int, factor_carga : float | None) -> int:
+    # Tamaño al que llegaría la tabla tras n inserciones más
+    if factor_carga is None:
+        return tam
+    while n > factor_carga * tam:
+        tam = siguiente_primo(2 * tam + 1)
+    return tam
+
 #Clase auxiliar para la tabla de dispersión abierta
 class Nodo:
     def __init__(self, clave : str, sinonimos : str):
@@ -45,19 +252,36 @@ class Nodo:
 #Tabla de dispersión abierta con
 # listas enlazadas para manejar colisiones
 class TablaAbierta:
-    def __init__(self, tam : int, dispersion : Callable[[str, int], int]):
+    def __init__(self, tam : int, dispersion : Callable[[str, int], int],
+                 factor_carga : float | None = None):
         self.tabla = [None] * tam
         self.tam = tam
         self.dispersion = dispersion
+        # Si factor_carga es None el tamaño es fijo, como en la práctica.
+        # Si no, al superarlo la tabla crece a un primo >= 2*tam y va
+        # trasladando pasos_rehash listas por operación (rehash incremental).
+        self.factor_carga = factor_carga
+        self.pasos_rehash = PASOS_REHASH
+        self.elementos = 0
+        self._antigua = None
+        self._tam_antigua = 0
+        self._pos_rehash = 0
+
+    def _buscar_en(self, tabla, tam, clave):
+        item = tabla[self.dispersion(clave, tam)]
+        colisiones = 0
+        while item is not None:
+            if item.clave == clave:
+                return item.sinonimos, colisiones
+            item = item.siguiente
+            colisiones += 1
+        return None, colisiones
+
     #Basicamente pide devolver el nodo
     # y el numero de colisiones que hubo
     def buscar(self, clave: str) -> tuple[ str | None, int]:
         indice=self.dispersion(clave,self.tam)
         item=self.tabla[indice]
-        if item is None:
-            #Si no hay nada en esa posicion,
-            # no hay colisiones y no existe la clave
-            return None,0
         colisiones=0
         while item is not None:
             if item.clave==clave:
@@ -66,12 +290,107 @@ class TablaAbierta:
                 return item.sinonimos,colisiones
             item=item.siguiente
             colisiones+=1
+        if self._antigua is not None:
+            # Durante el rehash la clave puede seguir en el array antiguo
+            sinonimos, col = self._buscar_en(self._antigua,
+                                             self._tam_antigua, clave)
+            return sinonimos, colisiones + col
         return None, colisiones
 
+    def buscar_lote(self, claves : list[str]) -> list[tuple[str | None, int]]:
+        """
+        buscar() de todas las claves en una llamada; mismos resultados y
+        en el mismo orden. Dispersa en lote y, si muchas claves comparten
+        cubeta, las agrupa para recorrer cada lista enlazada una vez.
+        """
+        if self._antigua is not None:
+            return [self.buscar(clave) for clave in claves]
+        indices = dispersar_lote(self.dispersion, claves, self.tam)
+        tabla = self.tabla
+        if 2 * len(set(indices)) > len(indices):
+            # Casi todas en cubetas distintas: agrupar no compensa
+            resultados = []
+            for clave, indice in zip(claves, indices):
+                item = tabla[indice]
+                colisiones = 0
+                while item is not None and item.clave != clave:
+                    item = item.siguiente
+                    colisiones += 1
+                resultados.append(
+                    (None if item is None else item.sinonimos, colisiones))
+            return resultados
+        por_cubeta = {}
+        for i, indice in enumerate(indices):
+            por_cubeta.setdefault(indice, []).append(i)
+        resultados = [None] * len(claves)
+        for indice, posiciones in por_cubeta.items():
+            vistas = {}  # clave -> resultado, de la primera aparición
+            item = tabla[indice]
+            colisiones = 0
+            while item is not None:
+                if item.clave not in vistas:
+                    vistas[item.clave] = (item.sinonimos, colisiones)
+                item = item.siguiente
+                colisiones += 1
+            ausente = (None, colisiones)
+            for i in posiciones:
+                resultados[i] = vistas.get(claves[i], ausente)
+        return resultados
+
+    def _iniciar_rehash(self, nuevo_tam : int | None = None):
+        self._antigua, self._tam_antigua = self.tabla, self.tam
+        self.tam = nuevo_tam or siguiente_primo(2 * self.tam + 1)
+        self.tabla = [None] * self.tam
+        self._pos_rehash = 0
+
+    def _rehash_pasos(self, pasos: int):
+        # Cada nodo se añade al final de su nueva lista: así se conserva el
+        # orden de las repetidas (la más reciente delante) y los nodos
+        # trasladados quedan detrás de los insertados durante el rehash,
+        # que son posteriores. colas guarda el último nodo de cada lista.
+        antigua, fin = self._antigua, self._tam_antigua
+        tabla = self.tabla
+        colas = {}
+        i = self._pos_rehash
+        limite = min(fin, i + pasos)
+        while i < limite:
+            item = antigua[i]
+            antigua[i] = None
+            while item is not None:
+                siguiente = item.siguiente
+                item.siguiente = None
+                indice = self.dispersion(item.clave, self.tam)
+                cola = colas.get(indice)
+                if cola is None:
+                    cola = tabla[indice]
+                    while cola is not None and cola.siguiente is not None:
+                        cola = cola.siguiente
+                if cola is None:
+                    tabla[indice] = item
+                else:
+                    cola.siguiente = item
+                colas[indice] = item
+                item = siguiente
+            i += 1
+        self._pos_rehash = i
+        if i >= fin:
+            self._antigua = None
+
+    def _preparar_insercion(self):
+        if self._antigua is not None:
+            self._rehash_pasos(self.pasos_rehash)
+        if (self.factor_carga is not None
+                and self.elementos + 1 > self.factor_carga * self.tam):
+            if self._antigua is not None:
+                self._rehash_pasos(self._tam_antigua)
+            self._iniciar_rehash()
+
     #Devolver el numero de colisiones que hubo al insertar
     def insertar(self, clave: str, sinonimos:str) -> int:
+        self._preparar_insercion()
         indice = self.dispersion(clave, self.tam)
         nuevo_nodo = Nodo(clave, sinonimos)
+        self.elementos += 1
 
         if self.tabla[indice] is None:
             self.tabla[indice] = nuevo_nodo
@@ -87,7 +406,38 @@ class TablaAbierta:
                 # en esa posición.
                 return 1
 
+    def insertar_lote(self, datos : list[tuple[str, str]]) -> int:
+        """
+        Inserta todos los pares de una vez: dispersa las claves en lote y
+        las enlaza sin pasar por insertar(). Con tamaño fijo el resultado
+        (tabla y colisiones) es el mismo que insertándolas una a una; con
+        factor_carga la tabla crece antes, directamente a su tamaño final.
+        """
+        nuevo_tam = tam_presizado(self.tam, self.elementos + len(datos),
+                                  self.factor_carga)
+        if nuevo_tam != self.tam:
+            if self._antigua is not None:
+                self._rehash_pasos(self._tam_antigua)
+            self._iniciar_rehash(nuevo_tam)
+        if self._antigua is not None:
+            self._rehash_pasos(self._tam_antigua)
+        tabla = self.tabla
+        indices = dispersar_lote(self.dispersion,
+                                 [clave for clave, _ in datos], self.tam)
+        colisiones = 0
+        for (clave, sinonimos), indice in zip(datos, indices):
+            nodo = Nodo(clave, sinonimos)
+            cabeza = tabla[indice]
+            if cabeza is not None:
+                nodo.siguiente = cabeza
+                colisiones += 1
+            tabla[indice] = nodo
+        self.elementos += len(datos)
+        return colisiones
+
     def mostrar(self):
+        if self._antigua is not None:
+            self._rehash_pasos(self._tam_antigua)
         for i, item in enumerate(self.tabla):
             # enumerate es una función incorporada en Python que permite
             # iterar sobre una secuencia y da tanto el índice como el
@@ -99,6 +449,51 @@ class TablaAbierta:
                 actual = actual.siguiente
             print("None")
 
+#Tabla abierta compacta: en lugar de un objeto Nodo por entrada, todas las
+# entradas viven en listas paralelas (arena) y las cadenas se enlazan por
+# índice. cabezas[i] es la última entrada insertada en la cubeta i y
+# siguiente[j] la entrada que la sigue en la cadena (-1 marca el final).
+class TablaAbiertaCompacta:
+    def __init__(self, tam : int, dispersion : Callable[[str, int], int]):
+        self.tam = tam
+        self.dispersion = dispersion
+        self.cabezas = array("i", [-1]) * tam
+        self.claves = []
+        self.sinonimos = []
+        self.siguiente = array("i")
+
+    def buscar(self, clave: str) -> tuple[str | None, int]:
+        claves = self.claves
+        siguiente = self.siguiente
+        actual = self.cabezas[self.dispersion(clave, self.tam)]
+        colisiones = 0
+        while actual != -1:
+            if claves[actual] == clave:
+                return self.sinonimos[actual], colisiones
+            actual = siguiente[actual]
+            colisiones += 1
+        return None, colisiones
+
+    def insertar(self, clave: str, sinonimos: str) -> int:
+        indice = self.dispersion(clave, self.tam)
+        cabeza = self.cabezas[indice]
+        # Inserción al principio de la cadena, como en TablaAbierta
+        self.cabezas[indice] = len(self.claves)
+        self.claves.append(clave)
+        self.sinonimos.append(sinonimos)
+        self.siguiente.append(cabeza)
+        return 0 if cabeza == -1 else 1
+
+    def mostrar(self):
+        for i in range(self.tam):
+            print(f"Índice {i}: ", end="")
+            actual = self.cabezas[i]
+            while actual != -1:
+                print(f"({self.claves[actual]}: {self.sinonimos[actual]}) -> ",
+                      end="")
+                actual = self.siguiente[actual]
+            print("None")
+
 #Funciones de exploración para la tabla de dispersión cerrada
 def exploracion_lineal(pos_ini: int, intento: int) -> int:
     return pos_ini + intento
@@ -122,13 +517,48 @@ class Entrada:
         self.clave = None
         # Los sinónimos almacenados [cite: 58]
         self.sinonimos = None
+        # Lápida: la casilla tuvo un dato que se eliminó. buscar() sigue
+        # explorando al pasar por ella e insertar() puede reutilizarla.
+        self.borrada = False
+
+# Casilla vacía compartida (nunca se modifica) para los arrays que crea el
+# redimensionado: [ENTRADA_VACIA] * tam es instantáneo, mientras que crear
+# tam objetos Entrada sería justo la pausa O(n) que se quiere evitar.
+# Al ocupar una de estas casillas se sustituye por una Entrada propia.
+ENTRADA_VACIA = Entrada()
+
 class TablaCerrada:
     def __init__(self, tam : int, dispersion : Callable[[str, int], int],
-        resol_colisiones : Callable[[int, int], int]):
+        resol_colisiones : Callable[[int, int], int],
+        factor_carga : float | None = None):
         self.tabla = [Entrada() for _ in range(tam)]
         self.tam = tam
         self.dispersion = dispersion
         self.resol_colisiones = resol_colisiones
+        # Igual que en TablaAbierta: None = tamaño fijo ("Tabla llena"),
+        # un valor (p. ej. 0.5) = crecimiento con rehash incremental.
+        self.factor_carga = factor_carga
+        self.pasos_rehash = PASOS_REHASH
+        self.elementos = 0
+        self.borradas = 0
+        self.max_borradas = MAX_BORRADAS
+        self.compactaciones = 0
+        self._antigua = None
+        self._tam_antigua = 0
+        self._pos_rehash = 0
+
+    def _buscar_en(self, tabla, tam, clave):
+        # Devuelve (entrada con la clave o None, colisiones)
+        indice = self.dispersion(clave, tam)
+        intento = 0
+        while intento < tam:
+            entrada = tabla[self.resol_colisiones(indice, intento) % tam]
+            if not entrada.ocupada and not entrada.borrada:
+                return None, intento
+            if entrada.clave == clave:
+                return entrada, intento
+            intento += 1
+        return None, intento
 
     def buscar(self, clave : str) -> tuple[str | None, int]:
         indice = self.dispersion(clave, self.tam)
@@ -139,22 +569,165 @@ class TablaCerrada:
             nueva_pos = self.resol_colisiones(indice, intento) % self.tam
             entrada = self.tabla[nueva_pos]
 
-            if not entrada.ocupada:
-                return None, colisiones  # La clave no está en la tabla
+            if not entrada.ocupada and not entrada.borrada:
+                break  # La clave no está en la tabla
 
             if entrada.clave == clave:
                 return entrada.sinonimos, colisiones  # Clave encontrada
 
             intento += 1
             colisiones += 1
-        # La clave no está en la tabla después
-        # de revisar todas las posiciones
+        if self._antigua is not None:
+            # Durante el rehash la clave puede seguir en el array antiguo
+            entrada, col = self._buscar_en(self._antigua,
+                                           self._tam_antigua, clave)
+            if entrada is not None:
+                return entrada.sinonimos, colisiones + col
+            return None, colisiones + col
+        # La clave no está en la tabla (o se revisaron
+        # todas las posiciones)
         return None, colisiones
 
-    def insertar(self, clave : str, sinonimos : str) -> int:
+    def buscar_lote(self, claves : list[str]) -> list[tuple[str | None, int]]:
+        """
+        buscar() de todas las claves en una llamada; mismos resultados y
+        en el mismo orden. Dispersa en lote y, si muchas claves comparten
+        posición inicial (y con ella la secuencia de exploración), las
+        agrupa para recorrer cada secuencia una sola vez.
+        """
+        if self._antigua is not None:
+            return [self.buscar(clave) for clave in claves]
+        tam, tabla = self.tam, self.tabla
+        resol = self.resol_colisiones
+        indices = dispersar_lote(self.dispersion, claves, tam)
+        if 2 * len(set(indices)) > len(indices):
+            # Casi todas con inicio distinto: agrupar no compensa
+            resultados = []
+            for clave, indice in zip(claves, indices):
+                intento = 0
+                resultado = None
+                while intento < tam:
+                    entrada = tabla[resol(indice, intento) % tam]
+                    if entrada.ocupada:
+                        if entrada.clave == clave:
+                            resultado = (entrada.sinonimos, intento)
+                            break
+                    elif not entrada.borrada:
+                        break
+                    intento += 1
+                resultados.append(resultado or (None, intento))
+            return resultados
+        por_inicio = {}
+        for i, indice in enumerate(indices):
+            por_inicio.setdefault(indice, []).append(i)
+        resultados = [None] * len(claves)
+        for indice, posiciones in por_inicio.items():
+            pendientes = {claves[i] for i in posiciones}
+            vistas = {}
+            intento = 0
+            while intento < tam:
+                entrada = tabla[resol(indice, intento) % tam]
+                if entrada.ocupada:
+                    if entrada.clave in pendientes:
+                        vistas[entrada.clave] = (entrada.sinonimos, intento)
+                        pendientes.discard(entrada.clave)
+                        if not pendientes:
+                            break
+                elif not entrada.borrada:
+                    break
+                intento += 1
+            ausente = (None, intento)
+            for i in posiciones:
+                resultados[i] = vistas.get(claves[i], ausente)
+        return resultados
+
+    def _iniciar_rehash(self, nuevo_tam : int | None = None):
+        # Sin nuevo_tam crece; con el tamaño actual compacta (quita lápidas)
+        self._antigua, self._tam_antigua = self.tabla, self.tam
+        self.tam = nuevo_tam or siguiente_primo(2 * self.tam + 1)
+        self.tabla = [ENTRADA_VACIA] * self.tam
+        self.borradas = 0
+        self._pos_rehash = 0
+
+    def _rehash_pasos(self, pasos: int):
+        # Del array antiguo solo se marcan lápidas (eliminar): así sus
+        # secuencias de exploración siguen valiendo para buscar().
+        antigua, fin = self._antigua, self._tam_antigua
+        i = self._pos_rehash
+        limite = min(fin, i + pasos)
+        while i < limite:
+            vieja = antigua[i]
+            if vieja.ocupada and not self._colocar(vieja.clave,
+                                                   vieja.sinonimos):
+                self._reconstruir()
+                return
+            i += 1
+        self._pos_rehash = i
+        if i >= fin:
+            self._antigua = None
+
+    def _colocar(self, clave : str, sinonimos : str) -> bool:
+        # Coloca sin comprobar duplicados; False si no encuentra hueco
         indice = self.dispersion(clave, self.tam)
         intento = 0
+        while intento < self.tam:
+            pos = self.resol_colisiones(indice, intento) % self.tam
+            entrada = self.tabla[pos]
+            if not entrada.ocupada and not entrada.borrada:
+                if entrada is ENTRADA_VACIA:
+                    entrada = self.tabla[pos] = Entrada()
+                entrada.clave = clave
+                entrada.sinonimos = sinonimos
+                entrada.ocupada = True
+                return True
+            intento += 1
+        return False
+
+    def _reconstruir(self):
+        """
+        Rehash completo a un tamaño mayor. Solo se usa si una secuencia de
+        exploración no encuentra hueco (p. ej. exploracion_doble con
+        tam < R, donde el paso puede ser múltiplo de tam).
+        """
+        vivas = {}
+        for tabla in (self._antigua or [], self.tabla):
+            for entrada in tabla:
+                if entrada.ocupada:
+                    vivas[entrada.clave] = entrada.sinonimos
+        self._antigua = None
+        self.borradas = 0
+        while True:
+            self.tam = siguiente_primo(2 * self.tam + 1)
+            self.tabla = [ENTRADA_VACIA] * self.tam
+            if all(self._colocar(c, v) for c, v in vivas.items()):
+                return
+
+    def _preparar_insercion(self):
+        if self._antigua is not None:
+            self._rehash_pasos(self.pasos_rehash)
+        if (self.factor_carga is not None
+                and self.elementos + 1 > self.factor_carga * self.tam):
+            if self._antigua is not None:
+                self._rehash_pasos(self._tam_antigua)
+            self._iniciar_rehash()
+        elif self.borradas > self.max_borradas * self.tam:
+            if self._antigua is not None:
+                self._rehash_pasos(self._tam_antigua)
+            self.compactaciones += 1
+            self._iniciar_rehash(self.tam)
+
+    def insertar(self, clave : str, sinonimos : str) -> int:
+        self._preparar_insercion()
         colisiones = 0
+        if self._antigua is not None:
+            # Si la clave sigue en el array antiguo ya está en la tabla
+            entrada, colisiones = self._buscar_en(self._antigua,
+                                                  self._tam_antigua, clave)
+            if entrada is not None:
+                return colisiones
+        indice = self.dispersion(clave, self.tam)
+        intento = 0
+        lapida = None  # primera casilla borrada vista, para reutilizarla
 
         while intento < self.tam:
             nueva_pos = self.resol_colisiones(indice, intento) % self.tam
@@ -165,23 +738,952 @@ class TablaCerrada:
                 # esta libre de claves repetidas, pero uno nunca sabe
                 return colisiones
             if not entrada.ocupada:
-                entrada.clave = clave
-                entrada.sinonimos = sinonimos
-                entrada.ocupada = True
-                # Retorna el número de colisiones al insertar
-                return colisiones
+                if entrada.borrada:
+                    # Hay que seguir explorando por si la clave está más
+                    # adelante, pero se recuerda el hueco.
+                    if lapida is None:
+                        lapida = entrada
+                else:
+                    if lapida is not None:
+                        entrada = lapida
+                        self.borradas -= 1
+                    elif entrada is ENTRADA_VACIA:
+                        entrada = self.tabla[nueva_pos] = Entrada()
+                    entrada.clave = clave
+                    entrada.sinonimos = sinonimos
+                    entrada.ocupada = True
+                    entrada.borrada = False
+                    self.elementos += 1
+                    # Retorna el número de colisiones al insertar
+                    return colisiones
             intento += 1
             colisiones += 1
+        if lapida is not None:
+            lapida.clave = clave
+            lapida.sinonimos = sinonimos
+            lapida.ocupada = True
+            lapida.borrada = False
+            self.borradas -= 1
+            self.elementos += 1
+            return colisiones
+        if self.factor_carga is not None:
+            self._reconstruir()
+            return self.insertar(clave, sinonimos)
         #No debería raisear esto generalmente
         raise Exception("Tabla llena, no se puede insertar")
 
+    def insertar_lote(self, datos : list[tuple[str, str]]) -> int:
+        """
+        Inserta todos los pares de una vez: dispersa las claves en lote y
+        explora con variables locales en lugar de llamar a insertar() por
+        cada par. Con tamaño fijo el resultado (tabla y colisiones) es el
+        mismo que insertándolas una a una; con factor_carga la tabla crece
+        antes, directamente a su tamaño final.
+        """
+        nuevo_tam = tam_presizado(self.tam, self.elementos + len(datos),
+                                  self.factor_carga)
+        if self._antigua is not None:
+            self._rehash_pasos(self._tam_antigua)
+        if nuevo_tam != self.tam:
+            self._iniciar_rehash(nuevo_tam)
+        elif self.borradas > self.max_borradas * self.tam:
+            # insertar() compactaría en la primera inserción
+            self.compactaciones += 1
+            self._iniciar_rehash(self.tam)
+        if self._antigua is not None:
+            self._rehash_pasos(self._tam_antigua)
+        tam, tabla = self.tam, self.tabla
+        resol = self.resol_colisiones
+        indices = dispersar_lote(self.dispersion,
+                                 [clave for clave, _ in datos], tam)
+        # Preparar el union-find cuesta O(tam): solo compensa con lotes
+        # grandes respecto a la tabla
+        if (resol is exploracion_lineal and self.borradas == 0
+                and (self.elementos == 0 or 4 * len(datos) >= tam)):
+            return self._insertar_lote_lineal(datos, indices)
+        total = 0
+        for k, (clave, sinonimos) in enumerate(datos):
+            if tam != self.tam:
+                # insertar() reconstruyó la tabla: las posiciones iniciales
+                # del resto del lote eran para el tamaño anterior
+                tam, tabla = self.tam, self.tabla
+                indices[k:] = dispersar_lote(
+                    self.dispersion, [c for c, _ in datos[k:]], tam)
+            indice = indices[k]
+            intento = 0
+            lapida = None
+            while intento < tam:
+                pos = resol(indice, intento) % tam
+                entrada = tabla[pos]
+                if entrada.ocupada:
+                    if entrada.clave == clave:
+                        lapida = None  # La clave ya existe, no se inserta
+                        break
+                elif entrada.borrada:
+                    if lapida is None:
+                        lapida = entrada
+                else:
+                    if lapida is None:
+                        if entrada is ENTRADA_VACIA:
+                            entrada = tabla[pos] = Entrada()
+                        lapida = entrada
+                    break
+                intento += 1
+            else:
+                if lapida is None:
+                    # Sin hueco: insertar() reconstruye o lanza la excepción
+                    total += self.insertar(clave, sinonimos)
+                    continue
+            total += intento
+            if lapida is not None:
+                if lapida.borrada:
+                    self.borradas -= 1
+                lapida.clave = clave
+                lapida.sinonimos = sinonimos
+                lapida.ocupada = True
+                lapida.borrada = False
+                self.elementos += 1
+        return total
+
+    def _insertar_lote_lineal(self, datos : list[tuple[str, str]],
+                              indices : list[int]) -> int:
+        """
+        insertar_lote para exploración lineal sin lápidas. La clave acaba
+        en la primera casilla libre desde su posición inicial, y sus
+        colisiones son la distancia hasta ella, así que en lugar de
+        recorrer el cúmulo se salta a esa casilla con un union-find
+        ("siguiente casilla libre") con compresión de caminos.
+        """
+        tam, tabla = self.tam, self.tabla
+        libre = list(range(tam))
+        posiciones = {}  # clave -> casilla, para detectar repetidas
+        if self.elementos:
+            for pos, entrada in enumerate(tabla):
+                if entrada.ocupada:
+                    libre[pos] = pos + 1 if pos + 1 < tam else 0
+                    posiciones[entrada.clave] = pos
+        total = 0
+        for (clave, sinonimos), indice in zip(datos, indices):
+            inicio = indice % tam
+            pos = posiciones.get(clave)
+            if pos is None:
+                if self.elementos == tam:
+                    raise Exception("Tabla llena, no se puede insertar")
+                pos = inicio
+                while libre[pos] != pos:
+                    libre[pos] = libre[libre[pos]]
+                    pos = libre[pos]
+                entrada = tabla[pos]
+                if entrada is ENTRADA_VACIA:
+                    entrada = tabla[pos] = Entrada()
+                entrada.clave = clave
+                entrada.sinonimos = sinonimos
+                entrada.ocupada = True
+                libre[pos] = pos + 1 if pos + 1 < tam else 0
+                posiciones[clave] = pos
+                self.elementos += 1
+            # Colisiones: casillas ocupadas entre la inicial y la suya
+            total += (pos - inicio) % tam
+        return total
+
+    def eliminar(self, clave : str) -> tuple[str | None, int]:
+        """
+        Elimina la clave dejando una lápida en su casilla.
+        Devuelve (sinónimos eliminados o None si no estaba, colisiones).
+        """
+        if self._antigua is not None:
+            self._rehash_pasos(self.pasos_rehash)
+        entrada, colisiones = self._buscar_en(self.tabla, self.tam, clave)
+        sinonimos = None
+        if entrada is not None:
+            sinonimos = entrada.sinonimos
+            self._marcar_borrada(entrada)
+            self.borradas += 1
+        if self._antigua is not None:
+            # También en el array antiguo, o el rehash la volvería a copiar
+            vieja, col = self._buscar_en(self._antigua, self._tam_antigua,
+                                         clave)
+            colisiones += col
+            if vieja is not None:
+                sinonimos = vieja.sinonimos
+                self._marcar_borrada(vieja)
+        if sinonimos is not None:
+            self.elementos -= 1
+            if (self._antigua is None
+                    and self.borradas > self.max_borradas * self.tam):
+                self.compactaciones += 1
+                self._iniciar_rehash(self.tam)
+        return sinonimos, colisiones
+
+    @staticmethod
+    def _marcar_borrada(entrada):
+        entrada.ocupada = False
+        entrada.borrada = True
+        entrada.clave = None
+        entrada.sinonimos = None
+
     def mostrar(self):
+        if self._antigua is not None:
+            self._rehash_pasos(self._tam_antigua)
         for i, entrada in enumerate(self.tabla):
             if entrada.ocupada:
                 print(f"Índice {i}: ({entrada.clave}: {entrada.sinonimos})")
+            elif entrada.borrada:
+                print(f"Índice {i}: Borrada")
             else:
                 print(f"Índice {i}: None")
 
+#Tabla cerrada compacta: "struct of arrays" en lugar de un objeto
+# Entrada por casilla (cada uno con su __dict__). Mismo contrato de
+# buscar/insertar/eliminar y mismas colisiones que TablaCerrada.
+VACIA, OCUPADA, BORRADA = 0, 1, 2
+
+class TablaCerradaCompacta:
+    def __init__(self, tam : int, dispersion : Callable[[str, int], int],
+        resol_colisiones : Callable[[int, int], int],
+        cachear_hash : bool = True):
+        self.tam = tam
+        self.dispersion = dispersion
+        self.resol_colisiones = resol_colisiones
+        # Un byte de estado por casilla (VACIA, OCUPADA o BORRADA)
+        self.estados = bytearray(tam)
+        self.claves = [None] * tam
+        self.sinonimos = [None] * tam
+        # hash() de cada clave guardado en un array de int64: descarta
+        # casi todas las claves distintas sin comparar cadenas.
+        self.hashes = array("q", bytes(8 * tam)) if cachear_hash else None
+        self.elementos = 0
+
+    def _posicion(self, clave : str) -> tuple[int, int]:
+        # (posición de la clave o -1, colisiones)
+        tam = self.tam
+        estados, claves, hashes = self.estados, self.claves, self.hashes
+        resol = self.resol_colisiones
+        h = hash(clave)
+        indice = self.dispersion(clave, tam)
+        intento = 0
+        while intento < tam:
+            pos = resol(indice, intento) % tam
+            estado = estados[pos]
+            if estado == VACIA:
+                return -1, intento
+            if (estado == OCUPADA and (hashes is None or hashes[pos] == h)
+                    and claves[pos] == clave):
+                return pos, intento
+            intento += 1
+        return -1, intento
+
+    def buscar(self, clave : str) -> tuple[str | None, int]:
+        # Igual que _posicion pero sin la llamada extra (camino caliente)
+        tam = self.tam
+        estados, claves, hashes = self.estados, self.claves, self.hashes
+        resol = self.resol_colisiones
+        h = hash(clave)
+        indice = self.dispersion(clave, tam)
+        intento = 0
+        while intento < tam:
+            pos = resol(indice, intento) % tam
+            estado = estados[pos]
+            if estado == VACIA:
+                return None, intento
+            if (estado == OCUPADA and (hashes is None or hashes[pos] == h)
+                    and claves[pos] == clave):
+                return self.sinonimos[pos], intento
+            intento += 1
+        return None, intento
+
+    def insertar(self, clave : str, sinonimos : str) -> int:
+        tam = self.tam
+        estados, claves = self.estados, self.claves
+        resol = self.resol_colisiones
+        indice = self.dispersion(clave, tam)
+        intento = 0
+        lapida = -1
+        while intento < tam:
+            pos = resol(indice, intento) % tam
+            estado = estados[pos]
+            if estado == OCUPADA and claves[pos] == clave:
+                return intento
+            if estado == BORRADA and lapida < 0:
+                lapida = pos
+            if estado == VACIA:
+                break
+            intento += 1
+        else:
+            if lapida < 0:
+                raise Exception("Tabla llena, no se puede insertar")
+        if lapida >= 0:
+            pos = lapida
+        estados[pos] = OCUPADA
+        claves[pos] = clave
+        self.sinonimos[pos] = sinonimos
+        if self.hashes is not None:
+            self.hashes[pos] = hash(clave)
+        self.elementos += 1
+        return intento
+
+    def eliminar(self, clave : str) -> tuple[str | None, int]:
+        pos, colisiones = self._posicion(clave)
+        if pos < 0:
+            return None, colisiones
+        sinonimos = self.sinonimos[pos]
+        self.estados[pos] = BORRADA
+        self.claves[pos] = self.sinonimos[pos] = None
+        self.elementos -= 1
+        return sinonimos, colisiones
+
+    def mostrar(self):
+        for i, estado in enumerate(self.estados):
+            if estado == OCUPADA:
+                print(f"Índice {i}: ({self.claves[i]}: {self.sinonimos[i]})")
+            elif estado == BORRADA:
+                print(f"Índice {i}: Borrada")
+            else:
+                print(f"Índice {i}: None")
+
+#Robin Hood: exploración lineal en la que, al insertar, la clave que
+# lleva más pasos desde su posición inicial se queda la casilla y la otra
+# sigue buscando. Las distancias quedan igualadas (poca varianza) y
+# buscar() puede parar en cuanto la distancia guardada es menor que la
+# recorrida. El borrado desplaza hacia atrás en lugar de dejar lápidas.
+class TablaRobinHood:
+    def __init__(self, tam : int, dispersion : Callable[[str, int], int]):
+        self.tam = tam
+        self.dispersion = dispersion
+        self.claves = [None] * tam
+        self.sinonimos = [None] * tam
+        # Distancia de cada clave a su posición inicial; -1 = casilla vacía
+        self.distancias = array("i", [-1]) * tam
+        self.elementos = 0
+
+    def _posicion(self, clave : str) -> tuple[int, int]:
+        # (posición de la clave o -1, colisiones)
+        tam, claves, distancias = self.tam, self.claves, self.distancias
+        pos = self.dispersion(clave, tam)
+        d = 0
+        while distancias[pos] >= d:
+            if claves[pos] == clave:
+                return pos, d
+            pos += 1
+            if pos == tam:
+                pos = 0
+            d += 1
+        return -1, d
+
+    def buscar(self, clave : str) -> tuple[str | None, int]:
+        pos, colisiones = self._posicion(clave)
+        if pos < 0:
+            return None, colisiones
+        return self.sinonimos[pos], colisiones
+
+    def insertar(self, clave : str, sinonimos : str) -> int:
+        tam, claves, distancias = self.tam, self.claves, self.distancias
+        pos = self.dispersion(clave, tam)
+        d = 0
+        while distancias[pos] >= d:
+            if claves[pos] == clave:
+                return d  # La clave ya existe, no se inserta
+            pos += 1
+            if pos == tam:
+                pos = 0
+            d += 1
+        if self.elementos == tam:
+            raise Exception("Tabla llena, no se puede insertar")
+        colisiones = d
+        # Desde aquí se van desplazando las claves "más ricas"
+        while distancias[pos] != -1:
+            if distancias[pos] < d:
+                clave, claves[pos] = claves[pos], clave
+                sinonimos, self.sinonimos[pos] = self.sinonimos[pos], sinonimos
+                d, distancias[pos] = distancias[pos], d
+            pos += 1
+            if pos == tam:
+                pos = 0
+            d += 1
+        claves[pos] = clave
+        self.sinonimos[pos] = sinonimos
+        distancias[pos] = d
+        self.elementos += 1
+        return colisiones
+
+    def eliminar(self, clave : str) -> tuple[str | None, int]:
+        pos, colisiones = self._posicion(clave)
+        if pos < 0:
+            return None, colisiones
+        tam, claves, distancias = self.tam, self.claves, self.distancias
+        sinonimos = self.sinonimos[pos]
+        # Desplazamiento hacia atrás: las claves siguientes que no están en
+        # su posición inicial retroceden una casilla.
+        siguiente = pos + 1 if pos + 1 < tam else 0
+        while distancias[siguiente] > 0:
+            claves[pos] = claves[siguiente]
+            self.sinonimos[pos] = self.sinonimos[siguiente]
+            distancias[pos] = distancias[siguiente] - 1
+            pos = siguiente
+            siguiente = pos + 1 if pos + 1 < tam else 0
+        claves[pos] = self.sinonimos[pos] = None
+        distancias[pos] = -1
+        self.elementos -= 1
+        return sinonimos, colisiones
+
+    def mostrar(self):
+        for i in range(self.tam):
+            if self.distancias[i] == -1:
+                print(f"Índice {i}: None")
+            else:
+                print(f"Índice {i}: ({self.claves[i]}: {self.sinonimos[i]})"
+                      f" [distancia {self.distancias[i]}]")
+
+#Cuckoo: cada clave solo puede estar en una de dos cubetas (una por cada
+# función de dispersión), así que buscar() mira como mucho
+# 2 * HUECOS_CUCKOO casillas. Si las dos cubetas están llenas se expulsa a
+# una clave a su cubeta alternativa, y así sucesivamente; si la cadena de
+# expulsiones no termina se reconstruye la tabla con más cubetas.
+HUECOS_CUCKOO = 4
+MAX_EXPULSIONES = 500
+
+class TablaCuckoo:
+    def __init__(self, tam : int, dispersion : Callable[[str, int], int],
+                 dispersion2 : Callable[[str, int], int] | None = None):
+        # tam es el número total de casillas, repartidas en cubetas
+        self.cubetas = max(1, tam // HUECOS_CUCKOO)
+        self.tam = self.cubetas * HUECOS_CUCKOO
+        self.dispersion = dispersion
+        # La segunda dispersión debe ser independiente de la primera
+        if dispersion2 is None:
+            dispersion2 = (dispersionFNV if dispersion is dispersionPolinomica
+                           else dispersionPolinomica)
+        self.dispersion2 = dispersion2
+        self.claves = [None] * self.tam
+        self.sinonimos = [None] * self.tam
+        self.elementos = 0
+        self.reconstrucciones = 0
+        self._rng = random.Random(0)
+
+    def _cubetas(self, clave : str) -> tuple[int, int]:
+        return (self.dispersion(clave, self.cubetas),
+                self.dispersion2(clave, self.cubetas))
+
+    def _posicion(self, clave : str) -> tuple[int, int]:
+        # (posición de la clave o -1, colisiones)
+        claves = self.claves
+        c1, c2 = self._cubetas(clave)
+        colisiones = 0
+        for cubeta in ((c1,) if c1 == c2 else (c1, c2)):
+            inicio = cubeta * HUECOS_CUCKOO
+            for pos in range(inicio, inicio + HUECOS_CUCKOO):
+                actual = claves[pos]
+                if actual == clave:
+                    return pos, colisiones
+                if actual is not None:
+                    colisiones += 1
+        return -1, colisiones
+
+    def buscar(self, clave : str) -> tuple[str | None, int]:
+        pos, colisiones = self._posicion(clave)
+        if pos < 0:
+            return None, colisiones
+        return self.sinonimos[pos], colisiones
+
+    def _hueco(self, cubeta : int) -> int:
+        inicio = cubeta * HUECOS_CUCKOO
+        for pos in range(inicio, inicio + HUECOS_CUCKOO):
+            if self.claves[pos] is None:
+                return pos
+        return -1
+
+    def _colocar(self, clave : str, sinonimos : str) -> tuple[int, int]:
+        """
+        Coloca una clave que no está en la tabla. Devuelve (expulsiones,
+        0) o, si no termina, (expulsiones, 1) con la clave que quedó fuera
+        guardada en self._fuera.
+        """
+        cubeta = -1  # cubeta de la que salió la clave expulsada
+        for expulsiones in range(MAX_EXPULSIONES):
+            c1, c2 = self._cubetas(clave)
+            for c in (c1, c2):
+                pos = self._hueco(c)
+                if pos >= 0:
+                    self.claves[pos] = clave
+                    self.sinonimos[pos] = sinonimos
+                    return expulsiones, 0
+            # Expulsa una clave al azar de la otra cubeta y sigue con ella
+            cubeta = c2 if cubeta == c1 else c1
+            pos = cubeta * HUECOS_CUCKOO + self._rng.randrange(HUECOS_CUCKOO)
+            clave, self.claves[pos] = self.claves[pos], clave
+            sinonimos, self.sinonimos[pos] = self.sinonimos[pos], sinonimos
+        self._fuera = (clave, sinonimos)
+        return MAX_EXPULSIONES, 1
+
+    def _reconstruir(self, clave : str, sinonimos : str):
+        # Rehash completo con el doble de cubetas
+        vivas = [(c, v) for c, v in zip(self.claves, self.sinonimos)
+                 if c is not None]
+        vivas.append((clave, sinonimos))
+        while True:
+            self.reconstrucciones += 1
+            self.cubetas = siguiente_primo(2 * self.cubetas + 1)
+            self.tam = self.cubetas * HUECOS_CUCKOO
+            self.claves = [None] * self.tam
+            self.sinonimos = [None] * self.tam
+            if all(self._colocar(c, v)[1] == 0 for c, v in vivas):
+                return
+
+    def insertar(self, clave : str, sinonimos : str) -> int:
+        pos, colisiones = self._posicion(clave)
+        if pos >= 0:
+            return colisiones  # La clave ya existe, no se inserta
+        expulsiones, fallo = self._colocar(clave, sinonimos)
+        if fallo:
+            self._reconstruir(*self._fuera)
+        self.elementos += 1
+        return colisiones + expulsiones
+
+    def eliminar(self, clave : str) -> tuple[str | None, int]:
+        pos, colisiones = self._posicion(clave)
+        if pos < 0:
+            return None, colisiones
+        sinonimos = self.sinonimos[pos]
+        self.claves[pos] = self.sinonimos[pos] = None
+        self.elementos -= 1
+        return sinonimos, colisiones
+
+    def mostrar(self):
+        for c in range(self.cubetas):
+            inicio = c * HUECOS_CUCKOO
+            print(f"Cubeta {c}: ", end="")
+            for pos in range(inicio, inicio + HUECOS_CUCKOO):
+                if self.claves[pos] is not None:
+                    print(f"({self.claves[pos]}: {self.sinonimos[pos]}) ",
+                          end="")
+            print()
+
+#Caché LRU delante de buscar(): guarda el resultado de las últimas
+# 'capacidad' claves buscadas (también las ausentes). Un acierto no
+# dispersa ni explora, así que devuelve 0 colisiones. insertar() y
+# eliminar() invalidan la clave afectada.
+class TablaConCache:
+    def __init__(self, tabla, capacidad : int = 1024):
+        self.tabla = tabla
+        self.capacidad = capacidad
+        self._cache = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.expulsiones = 0
+        self.invalidaciones = 0
+
+    def buscar(self, clave : str) -> tuple[str | None, int]:
+        cache = self._cache
+        if clave in cache:
+            cache.move_to_end(clave)
+            self.aciertos += 1
+            return cache[clave], 0
+        self.fallos += 1
+        sinonimos, colisiones = self.tabla.buscar(clave)
+        if self.capacidad > 0:
+            cache[clave] = sinonimos
+            if len(cache) > self.capacidad:
+                cache.popitem(last=False)  # la usada hace más tiempo
+                self.expulsiones += 1
+        return sinonimos, colisiones
+
+    def invalidar(self, clave : str):
+        if self._cache.pop(clave, self) is not self:
+            self.invalidaciones += 1
+
+    def insertar(self, clave : str, sinonimos : str) -> int:
+        self.invalidar(clave)
+        return self.tabla.insertar(clave, sinonimos)
+
+    def insertar_lote(self, datos : list[tuple[str, str]]) -> int:
+        for clave, _ in datos:
+            self.invalidar(clave)
+        return self.tabla.insertar_lote(datos)
+
+    def eliminar(self, clave : str) -> tuple[str | None, int]:
+        self.invalidar(clave)
+        return self.tabla.eliminar(clave)
+
+    def tasa_aciertos(self) -> float:
+        consultas = self.aciertos + self.fallos
+        return self.aciertos / consultas if consultas else 0.0
+
+    def __getattr__(self, nombre):
+        # tam, dispersion, mostrar... son los de la tabla envuelta
+        return getattr(self.tabla, nombre)
+
+#Índice de prefijos: claves ordenadas (con sus sinónimos en paralelo).
+# Las claves que empiezan por un prefijo son un tramo contiguo que se
+# localiza con bisect en O(|prefijo| log n).
+class IndicePrefijos:
+    def __init__(self, datos : list[tuple[str, str]]):
+        ordenados = sorted(datos)
+        self.claves = [clave for clave, _ in ordenados]
+        self.sinonimos = [sinonimos for _, sinonimos in ordenados]
+
+    def _tramo(self, prefijo : str) -> tuple[int, int]:
+        inicio = bisect.bisect_left(self.claves, prefijo)
+        if not prefijo:
+            return inicio, len(self.claves)
+        # Primera cadena mayor que todas las que empiezan por prefijo
+        fin = prefijo[:-1] + chr(ord(prefijo[-1]) + 1)
+        return inicio, bisect.bisect_left(self.claves, fin, inicio)
+
+    def contar(self, prefijo : str) -> int:
+        inicio, fin = self._tramo(prefijo)
+        return fin - inicio
+
+    def completar(self, prefijo : str,
+                  n : int = 10) -> list[tuple[str, str]]:
+        """Las n primeras claves (en orden) que empiezan por prefijo."""
+        inicio = bisect.bisect_left(self.claves, prefijo)
+        fin = min(len(self.claves), inicio + n)
+        resultado = []
+        for i in range(inicio, fin):
+            if not self.claves[i].startswith(prefijo):
+                break
+            resultado.append((self.claves[i], self.sinonimos[i]))
+        return resultado
+
+def entradas_tabla(tabla) -> Iterator[tuple[str, str]]:
+    # Todos los pares (clave, sinónimos) de una TablaAbierta o TablaCerrada
+    if tabla._antigua is not None:
+        tabla._rehash_pasos(tabla._tam_antigua)
+    for item in tabla.tabla:
+        if isinstance(tabla, TablaAbierta):
+            while item is not None:
+                yield item.clave, item.sinonimos
+                item = item.siguiente
+        elif item.ocupada:
+            yield item.clave, item.sinonimos
+
+def completar_recorriendo(tabla, prefijo : str,
+                          n : int = 10) -> list[tuple[str, str]]:
+    """Lo mismo que IndicePrefijos.completar recorriendo toda la tabla."""
+    return sorted((clave, sinonimos) for clave, sinonimos
+                  in entradas_tabla(tabla) if clave.startswith(prefijo))[:n]
+
+#Filtro de Bloom: m bits y k posiciones por clave. Si alguna de las k
+# está a 0 la clave seguro que no se insertó; si están todas a 1 puede
+# ser un falso positivo (con probabilidad ~tasa_fp). Las k posiciones
+# salen de dos mitades de hash(clave): h1 + i*h2 (doble dispersión).
+class FiltroBloom:
+    def __init__(self, n_esperados : int, tasa_fp : float = 0.01):
+        n = max(1, n_esperados)
+        self.m = max(8, math.ceil(-n * math.log(tasa_fp) / math.log(2) ** 2))
+        self.k = max(1, round(self.m / n * math.log(2)))
+        self.bits = bytearray((self.m + 7) // 8)
+
+    def _posiciones(self, clave : str):
+        h = hash(clave) & MASCARA_64
+        h1, h2 = h & 0xffffffff, (h >> 32) | 1
+        m = self.m
+        return [(h1 + i * h2) % m for i in range(self.k)]
+
+    def añadir(self, clave : str):
+        bits = self.bits
+        for pos in self._posiciones(clave):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, clave : str) -> bool:
+        # Sin pasar por _posiciones: una clave ausente suele descartarse
+        # en la primera o segunda posición
+        h = hash(clave) & MASCARA_64
+        h1, h2 = h & 0xffffffff, (h >> 32) | 1
+        m, bits = self.m, self.bits
+        for i in range(self.k):
+            pos = (h1 + i * h2) % m
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+#Tabla con filtro de Bloom delante: buscar() descarta sin dispersar ni
+# explorar (0 colisiones) las claves que el filtro sabe ausentes. El
+# filtro se mantiene al insertar; al borrar no se pueden quitar bits, así
+# que solo sube algo la tasa de falsos positivos. Si se insertan más
+# claves de las previstas se reconstruye con el doble de capacidad.
+class TablaConFiltro:
+    def __init__(self, tabla, capacidad : int, tasa_fp : float = 0.01):
+        self.tabla = tabla
+        self.tasa_fp = tasa_fp
+        self.capacidad = capacidad
+        self.filtro = FiltroBloom(capacidad, tasa_fp)
+        self.añadidas = 0
+        self.descartadas = 0
+        for clave, _ in entradas_tabla(tabla):
+            self._añadir(clave)
+
+    def _reconstruir(self, minimo : int):
+        while self.capacidad < minimo:
+            self.capacidad *= 2
+        self.filtro = FiltroBloom(self.capacidad, self.tasa_fp)
+        self.añadidas = 0
+        for c, _ in entradas_tabla(self.tabla):
+            self.filtro.añadir(c)
+            self.añadidas += 1
+
+    def _añadir(self, clave : str):
+        if self.añadidas >= self.capacidad:
+            self._reconstruir(2 * self.capacidad)
+        self.filtro.añadir(clave)
+        self.añadidas += 1
+
+    def buscar(self, clave : str) -> tuple[str | None, int]:
+        if clave not in self.filtro:
+            self.descartadas += 1
+            return None, 0
+        return self.tabla.buscar(clave)
+
+    # Primero la tabla y después el filtro: si este se reconstruye desde
+    # la tabla, las claves nuevas ya están en ella y no se pierden
+    def insertar(self, clave : str, sinonimos : str) -> int:
+        colisiones = self.tabla.insertar(clave, sinonimos)
+        self._añadir(clave)
+        return colisiones
+
+    def insertar_lote(self, datos : list[tuple[str, str]]) -> int:
+        colisiones = self.tabla.insertar_lote(datos)
+        if self.añadidas + len(datos) > self.capacidad:
+            # Una sola reconstrucción, que ya incluye todo el lote
+            self._reconstruir(self.añadidas + len(datos))
+        else:
+            for clave, _ in datos:
+                self._añadir(clave)
+        return colisiones
+
+    def __getattr__(self, nombre):
+        # eliminar, tam, dispersion... son los de la tabla envuelta
+        return getattr(self.tabla, nombre)
+
+#Índice inverso: de cada sinónimo a las entradas (cabeceras) que lo
+# listan. Las entradas se numeran en el orden en que llegan, así que cada
+# lista de apariciones es un array('i') ya ordenado y sin repetidos.
+class IndiceInverso:
+    def __init__(self, entradas : Iterator[tuple[str, str | bytes]]):
+        """
+        Se construye en una sola pasada sobre los pares (clave,
+        sinónimos) de leer_sinonimos o de leer_sinonimos_flujo.
+        """
+        self.claves = []
+        self.apariciones = {}
+        for id_entrada, (clave, sinonimos) in enumerate(entradas):
+            self.claves.append(clave)
+            if isinstance(sinonimos, bytes):
+                sinonimos = sinonimos.decode("utf-8")
+            for palabra in sinonimos.split(","):
+                palabra = palabra.strip()
+                lista = self.apariciones.get(palabra)
+                if lista is None:
+                    self.apariciones[palabra] = array("i", (id_entrada,))
+                elif lista[-1] != id_entrada:
+                    lista.append(id_entrada)
+
+    def ids(self, palabra : str) -> array:
+        return self.apariciones.get(palabra, array("i"))
+
+    def cabeceras(self, palabra : str) -> list[str]:
+        """Claves que listan palabra como sinónimo, en O(apariciones)."""
+        claves = self.claves
+        return [claves[i] for i in self.ids(palabra)]
+
+def cabeceras_recorriendo(datos : list[tuple[str, str]],
+                          palabra : str) -> list[str]:
+    """Lo mismo que IndiceInverso.cabeceras recorriendo todas las entradas."""
+    return [clave for clave, sinonimos in datos
+            if palabra in sinonimos
+            and palabra in (s.strip() for s in sinonimos.split(","))]
+
+#Snapshot binario de una tabla construida. Formato (orden de bytes nativo):
+#   cabecera  FORMATO_SNAPSHOT (ver guardar_tabla)
+#   casillas  int32 x tam: abierta -> primera entrada de la cadena;
+#             cerrada -> entrada de la casilla (VACIA_SNAPSHOT o
+#             BORRADA_SNAPSHOT si no hay)
+#   entradas  int32 x 5 por entrada: siguiente de la cadena (-1 al
+#             final), desplazamiento y longitud de la clave y de los
+#             sinónimos en el bloque de cadenas
+#   cadenas   claves y sinónimos en UTF-8, seguidos
+# TablaMapeada responde a buscar() leyendo directamente del fichero
+# proyectado en memoria, sin reconstruir la tabla.
+MAGICO_SNAPSHOT = b"TDSP"
+VERSION_SNAPSHOT = 1
+FORMATO_SNAPSHOT = "<4sHHIIII32s32s"
+TAM_CABECERA = struct.calcsize(FORMATO_SNAPSHOT)
+CAMPOS_ENTRADA = 5
+VACIA_SNAPSHOT, BORRADA_SNAPSHOT = -1, -2
+ABIERTA_SNAPSHOT, CERRADA_SNAPSHOT = 0, 1
+# Funciones que puede nombrar un snapshot
+FUNCIONES_SNAPSHOT = {f.__name__: f for f in (
+    dispersionA, dispersionB, dispersionFNV, dispersionPolinomica,
+    dispersionSipHash, exploracion_lineal, exploracion_cuadratica,
+    exploracion_doble)}
+
+def guardar_tabla(tabla : TablaAbierta | TablaCerrada, ruta : str) -> int:
+    """
+    Guarda la tabla en ruta con el formato de snapshot. Devuelve los
+    bytes escritos.
+    """
+    if tabla._antigua is not None:
+        tabla._rehash_pasos(tabla._tam_antigua)
+    if isinstance(tabla, TablaAbierta):
+        tipo, resol = ABIERTA_SNAPSHOT, ""
+    elif isinstance(tabla, TablaCerrada):
+        tipo, resol = CERRADA_SNAPSHOT, tabla.resol_colisiones.__name__
+    else:
+        raise TypeError("Solo se guardan TablaAbierta y TablaCerrada")
+    dispersion = tabla.dispersion.__name__
+    # Se exige el mismo objeto, no solo el nombre: las clausuras de
+    # dispersion_siphash con otra semilla también se llaman dispersionSipHash
+    for nombre, funcion in ((dispersion, tabla.dispersion),
+                            (resol, getattr(tabla, "resol_colisiones", None))):
+        if nombre and FUNCIONES_SNAPSHOT.get(nombre) is not funcion:
+            raise ValueError(f"Función {nombre} no admitida en un snapshot")
+    casillas = array("i", [VACIA_SNAPSHOT]) * tabla.tam
+    entradas = array("i")
+    cadenas = bytearray()
+
+    def nueva_entrada(clave, sinonimos, siguiente):
+        c, v = clave.encode("utf-8"), sinonimos.encode("utf-8")
+        entradas.extend((siguiente, len(cadenas), len(c),
+                         len(cadenas) + len(c), len(v)))
+        cadenas.extend(c)
+        cadenas.extend(v)
+        return len(entradas) // CAMPOS_ENTRADA - 1
+
+    for i, item in enumerate(tabla.tabla):
+        if tipo == ABIERTA_SNAPSHOT:
+            # Se escribe cada cadena del final al principio para poder
+            # enlazar cada entrada con la ya escrita
+            cadena = []
+            while item is not None:
+                cadena.append(item)
+                item = item.siguiente
+            for nodo in reversed(cadena):
+                casillas[i] = nueva_entrada(nodo.clave, nodo.sinonimos,
+                                            casillas[i])
+        elif item.ocupada:
+            casillas[i] = nueva_entrada(item.clave, item.sinonimos, -1)
+        elif item.borrada:
+            casillas[i] = BORRADA_SNAPSHOT
+    cabecera = struct.pack(FORMATO_SNAPSHOT, MAGICO_SNAPSHOT,
+                           VERSION_SNAPSHOT, tipo, tabla.tam,
+                           len(entradas) // CAMPOS_ENTRADA, len(cadenas),
+                           sys.byteorder == "little",
+                           dispersion.encode(), resol.encode())
+    with open(ruta, "wb") as f:
+        f.write(cabecera)
+        f.write(casillas.tobytes())
+        f.write(entradas.tobytes())
+        f.write(cadenas)
+    return TAM_CABECERA + 4 * (len(casillas) + len(entradas)) + len(cadenas)
+
+class TablaMapeada:
+    """
+    Tabla de solo lectura sobre un snapshot proyectado en memoria (mmap).
+    Mismo buscar() -> (sinónimos o None, colisiones) que la tabla
+    guardada. Abrirla no lee el fichero: las páginas se cargan al
+    consultarlas y varios procesos comparten la misma copia en la caché
+    de páginas del sistema.
+    """
+    def __init__(self, ruta : str):
+        with open(ruta, "rb") as f:
+            self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magico, version, self.tipo, self.tam, self.entradas_totales,
+         tam_cadenas, little, dispersion, resol) = struct.unpack_from(
+            FORMATO_SNAPSHOT, self._mapa)
+        if magico != MAGICO_SNAPSHOT or version != VERSION_SNAPSHOT:
+            self._mapa.close()
+            raise ValueError(f"{ruta} no es un snapshot de tabla")
+        if bool(little) != (sys.byteorder == "little"):
+            self._mapa.close()
+            raise ValueError(f"{ruta} se guardó con otro orden de bytes")
+        dispersion = dispersion.rstrip(b"\0").decode()
+        resol = resol.rstrip(b"\0").decode()
+        self.dispersion = FUNCIONES_SNAPSHOT[dispersion]
+        self.resol_colisiones = FUNCIONES_SNAPSHOT[resol] if resol else None
+        vista = memoryview(self._mapa)
+        fin_casillas = TAM_CABECERA + 4 * self.tam
+        fin_entradas = (fin_casillas
+                        + 4 * CAMPOS_ENTRADA * self.entradas_totales)
+        self.casillas = vista[TAM_CABECERA:fin_casillas].cast("i")
+        self.entradas = vista[fin_casillas:fin_entradas].cast("i")
+        self._inicio_cadenas = fin_entradas
+
+    def _cadena(self, desplazamiento : int, longitud : int) -> bytes:
+        inicio = self._inicio_cadenas + desplazamiento
+        return self._mapa[inicio:inicio + longitud]
+
+    def _sinonimos(self, e : int, codificada : bytes) -> str | None:
+        # Sinónimos de la entrada e si su clave es la buscada, si no None
+        base = CAMPOS_ENTRADA * e
+        entradas = self.entradas
+        if (entradas[base + 2] != len(codificada)
+                or self._cadena(entradas[base + 1],
+                                entradas[base + 2]) != codificada):
+            return None
+        return self._cadena(entradas[base + 3],
+                            entradas[base + 4]).decode("utf-8")
+
+    def buscar(self, clave : str) -> tuple[str | None, int]:
+        codificada = clave.encode("utf-8")
+        casillas, tam = self.casillas, self.tam
+        indice = self.dispersion(clave, tam)
+        colisiones = 0
+        if self.tipo == ABIERTA_SNAPSHOT:
+            e = casillas[indice]
+            while e != -1:
+                sinonimos = self._sinonimos(e, codificada)
+                if sinonimos is not None:
+                    return sinonimos, colisiones
+                e = self.entradas[CAMPOS_ENTRADA * e]
+                colisiones += 1
+            return None, colisiones
+        while colisiones < tam:
+            e = casillas[self.resol_colisiones(indice, colisiones) % tam]
+            if e == VACIA_SNAPSHOT:
+                break
+            if e != BORRADA_SNAPSHOT:
+                sinonimos = self._sinonimos(e, codificada)
+                if sinonimos is not None:
+                    return sinonimos, colisiones
+            colisiones += 1
+        return None, colisiones
+
+    def cerrar(self):
+        self.casillas.release()
+        self.entradas.release()
+        self._mapa.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+def memoria_estructura(tabla) -> int:
+    """
+    Bytes que ocupa la estructura de la tabla (sin contar las cadenas de
+    claves y sinónimos, que son las mismas en todas las variantes).
+    """
+    if isinstance(tabla, TablaCerradaCompacta):
+        total = (sys.getsizeof(tabla.estados) + sys.getsizeof(tabla.claves)
+                 + sys.getsizeof(tabla.sinonimos))
+        if tabla.hashes is not None:
+            total += sys.getsizeof(tabla.hashes)
+        return total
+    if isinstance(tabla, TablaAbiertaCompacta):
+        return (sys.getsizeof(tabla.cabezas) + sys.getsizeof(tabla.claves)
+                + sys.getsizeof(tabla.sinonimos)
+                + sys.getsizeof(tabla.siguiente))
+    total = sys.getsizeof(tabla.tabla)
+    vistas = set()
+    for item in tabla.tabla:
+        # En la abierta cada casilla es una lista de Nodo (o None)
+        while item is not None and id(item) not in vistas:
+            vistas.add(id(item))
+            total += sys.getsizeof(item) + sys.getsizeof(item.__dict__)
+            item = getattr(item, "siguiente", None)
+    return total
+
 #Validaciones y verificaciones del punto 2
 def dispersionTestTeoria(clave: str, tam_tabla: int) -> int:
     if clave in ("ANA", "JOSE", "OLGA"):
@@ -389,6 +1891,21 @@ def generar_claves_aleatorias(datos_completos: list[tuple[str, str]],
     """
     return random.sample([d[0] for d in datos_completos], k=n)
 
+def generar_claves_zipf(datos_completos: list[tuple[str, str]], n: int,
+                        s: float = 1.0,
+                        semilla: int | None = None) -> list[str]:
+    """
+    n claves con distribución de Zipf: la clave de rango r sale con
+    probabilidad proporcional a 1 / r^s. El rango se asigna barajando las
+    claves, para que las más buscadas no sean las primeras del fichero.
+    """
+    rng = random.Random(semilla)
+    claves = [d[0] for d in datos_completos]
+    rng.shuffle(claves)
+    acumulados = list(accumulate(1 / r ** s
+                                 for r in range(1, len(claves) + 1)))
+    return rng.choices(claves, cum_weights=acumulados, k=n)
+
 def wrapper_busqueda(tabla, claves_a_buscar: list[str]) -> int:
     """
     Función que realiza n búsquedas en la tabla.
@@ -400,15 +1917,25 @@ def wrapper_busqueda(tabla, claves_a_buscar: list[str]) -> int:
         total_colisiones += colisiones
     return total_colisiones
 
+def wrapper_busqueda_lote(tabla, claves_a_buscar: list[str]) -> int:
+    """
+    Como wrapper_busqueda pero con una sola llamada a buscar_lote.
+    Devuelve la suma total de colisiones.
+    """
+    return sum(colisiones for _, colisiones
+               in tabla.buscar_lote(claves_a_buscar))
+
 def _medir_tiempo_busqueda_aux(tabla, claves_a_buscar: list[str],
-                                K: int = 1000) -> tuple[float, str, int]:
+                                K: int = 1000,
+                                wrapper=wrapper_busqueda
+                                ) -> tuple[float, str, int]:
     """
     Mide el tiempo de buscar n claves en la tabla, con corrección K.
     Retorna (tiempo_µs, marca, colisiones_promedio)
     """
 
     ta = microsegundos()
-    colisiones_prueba = wrapper_busqueda(tabla, claves_a_buscar)
+    colisiones_prueba = wrapper(tabla, claves_a_buscar)
     td = microsegundos()
     t = td - ta
 
@@ -417,7 +1944,7 @@ def _medir_tiempo_busqueda_aux(tabla, claves_a_buscar: list[str],
 
     ta = microsegundos()
     for _ in range(K):    # Corrección por repeticiones K
-        wrapper_busqueda(tabla, claves_a_buscar)
+        wrapper(tabla, claves_a_buscar)
     td = microsegundos()
     t1 = td - ta
 
@@ -425,20 +1952,23 @@ def _medir_tiempo_busqueda_aux(tabla, claves_a_buscar: list[str],
     # claves se generaron fuera por cierto. Me estuvo dando problemas
     # al restarlo y obtener movidas raras.
 
-    colisiones_final = wrapper_busqueda(tabla, claves_a_buscar)
+    colisiones_final = wrapper(tabla, claves_a_buscar)
 
     return (t1 / K), "*", colisiones_final # t1/K es el tiempo promedio
 
 def medir_tiempo_busqueda(tabla_llena,
                            datos_completos: list[tuple[str, str]],
                            muestra_inicial: int,
-                           muestras: int, factor: int = 2
+                           muestras: int, factor: int = 2,
+                           por_lotes: bool = False
                            ) -> dict[int, tuple[float, str, int]]:
     """
     Mide el tiempo total de buscar n elementos (y cuenta las colisiones)
     para n = n_inicial, n*factor, n*(factor^2), etc.
+    Con por_lotes se busca con una llamada a buscar_lote por muestra.
     Retorna: {n: (tiempo_µs, marca, colisiones_totales)}
     """
+    wrapper = wrapper_busqueda_lote if por_lotes else wrapper_busqueda
     res: dict[int, tuple[float, str, int]] = {}
     n = muestra_inicial
     #Generamos n claves aleatorias para esta muestra
@@ -449,7 +1979,8 @@ def medir_tiempo_busqueda(tabla_llena,
         #La función auxliar basicamente añade
         # la corrección K para tiempos pequeños
         t, m, colisiones = _medir_tiempo_busqueda_aux(tabla_llena,
-                                                      claves_a_buscar)
+                                                      claves_a_buscar,
+                                                      wrapper=wrapper)
         if t < 0:
             #Lol, nunca debería pasar esto
             raise RuntimeError("Cronómetro interno no fiable.")
@@ -518,8 +2049,7 @@ def main_complejidad(datos_sinonimos):
             tabla_llena = ClaseTabla(tam, disp_func, resol_func)
             #Esta asignación es solo para llenar
             # la tabla y no usar el valor devuelto
-        _ = insertar_datos_y_contar_colisiones(tabla_llena,
-                                                datos_sinonimos)
+        _ = tabla_llena.insertar_lote(datos_sinonimos)
         #Tan solo una pequeña pijada estética
         print(f"Midiendo tiempo de búsqueda para {nombre_test}...")
 
@@ -560,6 +2090,862 @@ CONFIGURACIONES = [
           "Tabla Cerrada, Disp. B, Doble"),
     ]
 
+##Redimensionado automático con rehash incremental
+def datos_ampliados(datos: list[tuple[str, str]],
+                    veces: int) -> list[tuple[str, str]]:
+    """
+    Multiplica el diccionario: cada clave se repite 'veces' veces con un
+    prefijo numérico distinto (al principio, para que dispersionA/B, que
+    solo miran 8 caracteres, sigan distinguiéndolas).
+    """
+    return [(f"{i}{clave}", sinonimos)
+            for i in range(veces) for clave, sinonimos in datos]
+
+def _medir_insercion_redimensionable(tabla, datos) -> tuple[float, float]:
+    # Devuelve (tiempo total en ms, peor inserción individual en µs)
+    peor = 0
+    ta = time.perf_counter_ns()
+    for clave, sinonimos in datos:
+        t0 = time.perf_counter_ns()
+        tabla.insertar(clave, sinonimos)
+        t = time.perf_counter_ns() - t0
+        if t > peor:
+            peor = t
+    total = time.perf_counter_ns() - ta
+    return total / 1e6, peor / 1e3
+
+def experimento_redimensionado(datos: list[tuple[str, str]],
+                               multiplicadores=(1, 4, 16)):
+    """
+    Construye tablas que empiezan con 11 casillas y crecen solas con
+    conjuntos cada vez mayores. Compara el rehash incremental
+    (PASOS_REHASH casillas por operación) con el rehash completo de golpe:
+    el tiempo total es parecido, pero la peor inserción no paga O(n).
+    """
+    configuraciones = [
+        ("Abierta, Disp. B (carga 1.0)",
+         lambda: TablaAbierta(11, dispersionB, factor_carga=1.0)),
+        ("Cerrada, Disp. B, Lineal (carga 0.5)",
+         lambda: TablaCerrada(11, dispersionB, exploracion_lineal, 0.5)),
+        ("Cerrada, Disp. B, Doble (carga 0.5)",
+         lambda: TablaCerrada(11, dispersionB, exploracion_doble, 0.5)),
+    ]
+    print("\n*** Redimensionado automático ***")
+    print(f"{'Tabla':>38} {'n':>8} {'tam final':>10} {'modo':>12}"
+          f" {'total[ms]':>10} {'peor insert[µs]':>16}")
+    for veces in multiplicadores:
+        conjunto = datos_ampliados(datos, veces)
+        for nombre, crear in configuraciones:
+            for modo, pasos in (("incremental", PASOS_REHASH),
+                                ("completo", None)):
+                tabla = crear()
+                tabla.pasos_rehash = pasos or len(conjunto) * 4
+                total, peor = _medir_insercion_redimensionable(tabla,
+                                                               conjunto)
+                print(f"{nombre:>38} {len(conjunto):8d} {tabla.tam:10d}"
+                      f" {modo:>12} {total:10.1f} {peor:16.1f}")
+    # La abierta admite claves repetidas: crecer no debe cambiar cuál
+    # devuelve buscar (la última insertada)
+    fija = TablaAbierta(TAM_ABIERTA, dispersionB)
+    creciente = TablaAbierta(11, dispersionB, factor_carga=1.0)
+    for i, (clave, _) in enumerate(datos[:2000] * 2):
+        fija.insertar(clave, str(i))
+        creciente.insertar(clave, str(i))
+    if any(creciente.buscar(clave)[0] != fija.buscar(clave)[0]
+           for clave, _ in datos[:2000]):
+        raise RuntimeError("El rehash cambia el orden de las repetidas")
+    print()
+
+##Borrado con lápidas
+def _carga_de_trabajo_mixta(tabla: TablaCerrada,
+                            presentes: list[str], reserva: list[str],
+                            operaciones: int) -> dict[str, float]:
+    """
+    Mezcla al azar inserciones (de claves de la reserva), eliminaciones y
+    búsquedas (mitad aciertos, mitad fallos) y devuelve la media y el
+    máximo de colisiones de las búsquedas.
+    """
+    presentes, reserva = presentes.copy(), reserva.copy()
+    aciertos, fallos = [], []
+    for _ in range(operaciones):
+        op = random.random()
+        if op < 1 / 3 and reserva:
+            clave = reserva.pop(random.randrange(len(reserva)))
+            tabla.insertar(clave, "sinonimo")
+            presentes.append(clave)
+        elif op < 2 / 3 and presentes:
+            i = random.randrange(len(presentes))
+            presentes[i], presentes[-1] = presentes[-1], presentes[i]
+            clave = presentes.pop()
+            tabla.eliminar(clave)
+            reserva.append(clave)
+        elif random.random() < 0.5 and presentes:
+            aciertos.append(tabla.buscar(random.choice(presentes))[1])
+        elif reserva:
+            fallos.append(tabla.buscar(random.choice(reserva))[1])
+    return {
+        "media_acierto": sum(aciertos) / max(1, len(aciertos)),
+        "media_fallo": sum(fallos) / max(1, len(fallos)),
+        "max": max(aciertos + fallos, default=0),
+    }
+
+def experimento_borrado(datos: list[tuple[str, str]],
+                        operaciones: int = 60000,
+                        umbrales=(0.05, MAX_BORRADAS, float("inf"))):
+    """
+    Carga el 80% del diccionario en tablas cerradas (Disp. B) y aplica una
+    carga mixta de inserción/eliminación/búsqueda. Compara las colisiones
+    de búsqueda con varios umbrales de compactación (fracción máxima de
+    lápidas), incluido no compactar nunca.
+    """
+    claves = [clave for clave, _ in datos]
+    corte = len(claves) * 4 // 5
+    presentes, reserva = claves[:corte], claves[corte:]
+    print("\n*** Borrado con lápidas: colisiones por búsqueda ***")
+    print(f"{'Tabla':>32} {'máx lápidas':>12} {'media acierto':>14}"
+          f" {'media fallo':>12} {'máx':>6} {'lápidas':>8}"
+          f" {'compactaciones':>15}")
+    for nombre, resol in (("Lineal", exploracion_lineal),
+                          ("Cuadrática", exploracion_cuadratica),
+                          ("Doble", exploracion_doble)):
+        for umbral in umbrales:
+            random.seed(0)
+            tabla = TablaCerrada(TAM_CERRADA, dispersionB, resol)
+            tabla.max_borradas = umbral
+            for clave in presentes:
+                tabla.insertar(clave, "sinonimo")
+            r = _carga_de_trabajo_mixta(tabla, presentes, reserva,
+                                        operaciones)
+            print(f"{'Cerrada, Disp. B, ' + nombre:>32} {umbral:12.2f}"
+                  f" {r['media_acierto']:14.3f} {r['media_fallo']:12.3f}"
+                  f" {r['max']:6d} {tabla.borradas:8d}"
+                  f" {tabla.compactaciones:15d}")
+    print()
+
+##Almacenamiento compacto de la tabla cerrada
+def comparar_almacenamiento(datos: list[tuple[str, str]],
+                            n_busquedas: int = 2000):
+    """
+    Para las 6 configuraciones cerradas de CONFIGURACIONES compara la
+    tabla de objetos Entrada con la compacta (con y sin hash cacheado):
+    memoria de la estructura y búsquedas por segundo.
+    """
+    claves = generar_claves_aleatorias(datos, n_busquedas)
+    print("\n*** Almacenamiento de la tabla cerrada ***")
+    print(f"{'Tabla':>36} {'variante':>18} {'memoria[MB]':>12}"
+          f" {'búsquedas/s':>12} {'colisiones':>12}")
+    for ClaseTabla, tam, disp_func, resol_func, nombre in CONFIGURACIONES:
+        if resol_func is None:
+            continue
+        variantes = [
+            ("objetos Entrada", ClaseTabla(tam, disp_func, resol_func)),
+            ("compacta", TablaCerradaCompacta(tam, disp_func, resol_func,
+                                              cachear_hash=False)),
+            ("compacta + hash", TablaCerradaCompacta(tam, disp_func,
+                                                     resol_func)),
+        ]
+        for variante, tabla in variantes:
+            insertar_datos_y_contar_colisiones(tabla, datos)
+            ta = time.perf_counter()
+            colisiones = wrapper_busqueda(tabla, claves)
+            t = time.perf_counter() - ta
+            print(f"{nombre:>36} {variante:>18}"
+                  f" {memoria_estructura(tabla) / 1e6:12.2f}"
+                  f" {len(claves) / t:12.0f} {colisiones:12d}")
+    print()
+
+##Almacenamiento compacto de la tabla abierta
+def comparar_almacenamiento_abierta(datos: list[tuple[str, str]],
+                                    n_busquedas: int = 16000):
+    """
+    Tabla abierta de objetos Nodo frente a la de arena con índices, para
+    las configuraciones A y B: memoria de la estructura, tiempo de
+    construcción y búsquedas por segundo.
+    """
+    claves = generar_claves_aleatorias(datos, n_busquedas)
+    print("\n*** Almacenamiento de la tabla abierta ***")
+    print(f"{'Tabla':>24} {'variante':>14} {'memoria[MB]':>12}"
+          f" {'B/entrada':>10} {'construir[ms]':>14} {'búsquedas/s':>12}"
+          f" {'colisiones':>11}")
+    for ClaseTabla, tam, disp_func, resol_func, nombre in CONFIGURACIONES:
+        if resol_func is not None:
+            continue
+        for variante, Clase in (("nodos", TablaAbierta),
+                                ("arena", TablaAbiertaCompacta)):
+            tabla = Clase(tam, disp_func)
+            ta = time.perf_counter()
+            insertar_datos_y_contar_colisiones(tabla, datos)
+            t_construir = time.perf_counter() - ta
+            ta = time.perf_counter()
+            colisiones = wrapper_busqueda(tabla, claves)
+            t = time.perf_counter() - ta
+            memoria = memoria_estructura(tabla)
+            print(f"{nombre:>24} {variante:>14} {memoria / 1e6:12.2f}"
+                  f" {memoria / len(datos):10.1f} {t_construir * 1e3:14.1f}"
+                  f" {len(claves) / t:12.0f} {colisiones:11d}")
+    print()
+
+##Construcción por lotes
+def comparar_carga_lote(datos: list[tuple[str, str]]):
+    """
+    Tiempo de construir cada tabla de CONFIGURACIONES insertando par a par
+    (insertar_datos_y_contar_colisiones) y con insertar_lote, comprobando
+    que las colisiones totales coinciden. Con una tabla que crece desde
+    tamaño pequeño (factor_carga, exploración doble) las colisiones
+    cambian, así que se comprueba que busca igual que la construida par
+    a par.
+    """
+    print("\n*** Construcción por lotes ***")
+    print(f"{'Tabla':>36} {'colisiones':>11} {'uno a uno[ms]':>14}"
+          f" {'lote[ms]':>10} {'aceleración':>12}")
+    for ClaseTabla, tam, disp_func, resol_func, nombre in CONFIGURACIONES:
+        tiempos, colisiones = [], []
+        for por_lotes in (False, True):
+            if resol_func is None:
+                tabla = ClaseTabla(tam, disp_func)
+            else:
+                tabla = ClaseTabla(tam, disp_func, resol_func)
+            ta = time.perf_counter()
+            if por_lotes:
+                colisiones.append(tabla.insertar_lote(datos))
+            else:
+                colisiones.append(
+                    insertar_datos_y_contar_colisiones(tabla, datos))
+            tiempos.append(time.perf_counter() - ta)
+        if colisiones[0] != colisiones[1]:
+            raise RuntimeError(f"{nombre}: colisiones distintas por lotes")
+        print(f"{nombre:>36} {colisiones[0]:11d} {tiempos[0] * 1e3:14.1f}"
+              f" {tiempos[1] * 1e3:10.1f} {tiempos[0] / tiempos[1]:11.1f}x")
+    # Lotes que obligan a reconstruir la tabla a mitad de inserción
+    for inicio in range(0, len(datos), 1000):
+        lote = datos[inicio:inicio + 30]
+        uno_a_uno = TablaCerrada(11, dispersionB, exploracion_doble, 0.5)
+        insertar_datos_y_contar_colisiones(uno_a_uno, lote)
+        por_lotes = TablaCerrada(11, dispersionB, exploracion_doble, 0.5)
+        por_lotes.insertar_lote(lote)
+        if any(por_lotes.buscar(clave)[0] != uno_a_uno.buscar(clave)[0]
+               for clave, _ in lote):
+            raise RuntimeError("Tabla creciente: contenido distinto por "
+                               "lotes")
+    print("Tabla Cerrada creciente (tam=11, carga 0.5, Doble): mismo "
+          "contenido por lotes\n")
+
+##Snapshot binario con búsquedas sobre mmap
+def experimento_snapshot(datos: list[tuple[str, str]],
+                         n_busquedas: int = 16000):
+    """
+    Para cada configuración de CONFIGURACIONES: arranque leyendo
+    sinonimos.txt y construyendo la tabla frente a abrir su snapshot,
+    tamaño del fichero y búsquedas por segundo en memoria y sobre mmap.
+    Comprueba que el snapshot da los mismos resultados (sinónimos y
+    colisiones) para todas las claves y para claves ausentes.
+    """
+    claves = generar_claves_aleatorias(datos, n_busquedas)
+    comprobar = [clave for clave, _ in datos] + generar_claves_ausentes(
+        datos, 2000, semilla=0)
+    print("\n*** Snapshot binario ***")
+    print(f"{'Tabla':>36} {'fichero[MB]':>11} {'construir[ms]':>14}"
+          f" {'abrir[ms]':>10} {'memoria/s':>10} {'mmap/s':>10}")
+    with tempfile.TemporaryDirectory() as directorio:
+        for ClaseTabla, tam, disp_func, resol_func, nombre in CONFIGURACIONES:
+            ta = time.perf_counter()
+            if resol_func is None:
+                tabla = ClaseTabla(tam, disp_func)
+            else:
+                tabla = ClaseTabla(tam, disp_func, resol_func)
+            tabla.insertar_lote(leer_sinonimos())
+            t_construir = time.perf_counter() - ta
+            ruta = os.path.join(directorio, "tabla.snap")
+            tam_fichero = guardar_tabla(tabla, ruta)
+            ta = time.perf_counter()
+            with TablaMapeada(ruta) as mapeada:
+                t_abrir = time.perf_counter() - ta
+                for clave in comprobar:
+                    if mapeada.buscar(clave) != tabla.buscar(clave):
+                        raise RuntimeError(f"{nombre}: snapshot distinto"
+                                           f" para {clave!r}")
+                ritmos = []
+                for t in (tabla, mapeada):
+                    ta = time.perf_counter()
+                    wrapper_busqueda(t, claves)
+                    ritmos.append(len(claves) / (time.perf_counter() - ta))
+            print(f"{nombre:>36} {tam_fichero / 1e6:11.2f}"
+                  f" {t_construir * 1e3:14.1f} {t_abrir * 1e3:10.2f}"
+                  f" {ritmos[0]:10.0f} {ritmos[1]:10.0f}")
+    print()
+
+##Carga en flujo con sinónimos perezosos
+def _pico_memoria(funcion) -> tuple[object, float, float]:
+    # (resultado, pico en MB, memoria que sigue ocupada al terminar en MB)
+    tracemalloc.start()
+    resultado = funcion()
+    actual, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, pico / 1e6, actual / 1e6
+
+def experimento_carga_flujo(datos: list[tuple[str, str]],
+                            veces: tuple[int, ...] = (1, 10)):
+    """
+    Pico de memoria (tracemalloc) y tiempo de cargar un diccionario de
+    'veces' x 19062 entradas en una tabla cerrada redimensionable:
+    leer_sinonimos + insertar_lote frente a DiccionarioPerezoso.cargar.
+    Comprueba que ambos dan los mismos sinónimos.
+    """
+    print("\n*** Carga en flujo ***")
+    print(f"{'entradas':>9} {'carga':>12} {'pico[MB]':>9}"
+          f" {'final[MB]':>10} {'tiempo[ms]':>11}")
+    with tempfile.TemporaryDirectory() as directorio:
+        for v in veces:
+            ruta = os.path.join(directorio, "sinonimos.txt")
+            with open(ruta, "w", encoding="utf-8") as f:
+                for clave, sinonimos in datos_ampliados(datos, v):
+                    f.write(f"{clave}\t{sinonimos}\n")
+
+            def completa():
+                tabla = TablaCerrada(TAM_CERRADA, dispersionB,
+                                     exploracion_lineal, factor_carga=0.5)
+                tabla.insertar_lote(leer_sinonimos(ruta))
+                return tabla
+
+            def en_flujo(internar):
+                diccionario = DiccionarioPerezoso(
+                    TablaCerrada(TAM_CERRADA, dispersionB,
+                                 exploracion_lineal, factor_carga=0.5))
+                diccionario.cargar(ruta, internar=internar)
+                return diccionario
+
+            resultados = []
+            for nombre, funcion in (
+                    ("completa", completa),
+                    ("en flujo", lambda: en_flujo(True)),
+                    ("sin intern", lambda: en_flujo(False))):
+                ta = time.perf_counter()
+                resultado, pico, final = _pico_memoria(funcion)
+                t = time.perf_counter() - ta
+                resultados.append(resultado)
+                print(f"{v * len(datos):9d} {nombre:>12} {pico:9.1f}"
+                      f" {final:10.1f} {t * 1e3:11.0f}")
+            tabla = resultados[0]
+            for clave in generar_claves_aleatorias(datos, 500):
+                clave = f"{v - 1}{clave}"
+                for diccionario in resultados[1:]:
+                    if diccionario.buscar_texto(clave) != tabla.buscar(clave):
+                        raise RuntimeError(
+                            f"Carga en flujo distinta: {clave!r}")
+    print()
+
+##Servidor local de búsquedas (asyncio)
+# Protocolo por líneas: cada petición es una línea con una o más claves
+# separadas por tabuladores; la respuesta es una línea JSON con
+# [sinónimos o null, colisiones] por clave, en el mismo orden. Se puede
+# encadenar peticiones sin esperar respuesta (pipelining): se responden en
+# el orden en que llegan. Una clave vacía da [null, 0] y un error al
+# buscar, {"error": mensaje}.
+async def servir_sinonimos(tabla, host : str = "127.0.0.1", puerto : int = 0,
+                           ruta_unix : str | None = None) -> asyncio.Server:
+    """
+    Arranca el servidor sobre cualquier tabla con buscar() (también una
+    TablaMapeada). Con ruta_unix escucha en un socket Unix; si no, en
+    TCP (puerto 0 = uno libre, ver server.sockets).
+    """
+    async def atender(lector, escritor):
+        try:
+            while linea := await lector.readline():
+                claves = linea.decode("utf-8").rstrip("\n").split("\t")
+                try:
+                    respuesta = [tabla.buscar(clave) if clave else (None, 0)
+                                 for clave in claves]
+                except Exception as e:
+                    # Se responde con el error y la conexión sigue abierta
+                    respuesta = {"error": str(e)}
+                escritor.write(json.dumps(respuesta, ensure_ascii=False)
+                               .encode("utf-8") + b"\n")
+                # drain() solo espera si el buffer de salida está lleno
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    if ruta_unix is not None:
+        return await asyncio.start_unix_server(atender, path=ruta_unix)
+    return await asyncio.start_server(atender, host, puerto)
+
+async def _conectar(direccion):
+    if isinstance(direccion, str):
+        return await asyncio.open_unix_connection(direccion)
+    return await asyncio.open_connection(*direccion)
+
+async def generar_carga(direccion, claves : list[str], peticiones : int,
+                        conexiones : int = 4, por_peticion : int = 1,
+                        en_vuelo : int = 1) -> dict:
+    """
+    Cliente de carga: 'conexiones' conexiones mandan en total 'peticiones'
+    peticiones de 'por_peticion' claves tomadas de claves, con hasta
+    'en_vuelo' peticiones sin responder por conexión. direccion es
+    (host, puerto) o la ruta de un socket Unix. Devuelve peticiones y
+    claves por segundo y percentiles de latencia por petición (µs).
+    """
+    latencias = []
+    rng = random.Random(0)
+
+    async def conexion(n):
+        lector, escritor = await _conectar(direccion)
+        enviadas = deque()
+        hueco = asyncio.Semaphore(en_vuelo)
+
+        async def recibir():
+            for _ in range(n):
+                linea = await lector.readline()
+                latencias.append(time.perf_counter() - enviadas.popleft())
+                if len(json.loads(linea)) != por_peticion:
+                    raise RuntimeError("Respuesta incompleta del servidor")
+                hueco.release()
+
+        receptor = asyncio.create_task(recibir())
+        for _ in range(n):
+            await hueco.acquire()
+            peticion = "\t".join(rng.choices(claves, k=por_peticion))
+            enviadas.append(time.perf_counter())
+            escritor.write(peticion.encode("utf-8") + b"\n")
+            await escritor.drain()
+        await receptor
+        escritor.close()
+        await escritor.wait_closed()
+
+    reparto = [peticiones // conexiones + (i < peticiones % conexiones)
+               for i in range(conexiones)]
+    ta = time.perf_counter()
+    await asyncio.gather(*(conexion(n) for n in reparto))
+    t = time.perf_counter() - ta
+    latencias.sort()
+    return {
+        "peticiones/s": peticiones / t,
+        "claves/s": peticiones * por_peticion / t,
+        **{f"p{p}": _percentil(latencias, p) * 1e6 for p in (50, 95, 99)},
+    }
+
+def experimento_servidor(datos: list[tuple[str, str]],
+                         peticiones: int = 4000,
+                         pruebas=((1, 1), (1, 32), (16, 1), (16, 32))):
+    """
+    Levanta el servidor con la tabla cerrada B lineal y lo carga desde el
+    mismo proceso por TCP y por socket Unix, con distintos tamaños de
+    petición (claves por petición) y profundidades de pipelining.
+    """
+    tabla = TablaCerrada(TAM_CERRADA, dispersionB, exploracion_lineal)
+    tabla.insertar_lote(datos)
+    claves = [clave for clave, _ in datos]
+
+    async def medir():
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "sinonimos.sock")
+            for transporte in ("TCP", "Unix"):
+                if transporte == "TCP":
+                    servidor = await servir_sinonimos(tabla)
+                    direccion = servidor.sockets[0].getsockname()[:2]
+                else:
+                    servidor = await servir_sinonimos(tabla, ruta_unix=ruta)
+                    direccion = ruta
+                async with servidor:
+                    for por_peticion, en_vuelo in pruebas:
+                        r = await generar_carga(direccion, claves, peticiones,
+                                                por_peticion=por_peticion,
+                                                en_vuelo=en_vuelo)
+                        print(f"{transporte:>6} {por_peticion:8d}"
+                              f" {en_vuelo:9d} {r['peticiones/s']:12.0f}"
+                              f" {r['claves/s']:10.0f} {r['p50']:9.0f}"
+                              f" {r['p95']:9.0f} {r['p99']:9.0f}")
+
+    print("\n*** Servidor de búsquedas ***")
+    print(f"{'socket':>6} {'claves/p':>8} {'en vuelo':>9}"
+          f" {'peticiones/s':>12} {'claves/s':>10} {'p50[µs]':>9}"
+          f" {'p95[µs]':>9} {'p99[µs]':>9}")
+    asyncio.run(medir())
+    print()
+
+##Caché de claves frecuentes
+def experimento_cache(datos: list[tuple[str, str]], n_busquedas: int = 20000,
+                      capacidades=(0, 256, 1024, 4096), s: float = 1.0):
+    """
+    Búsquedas con claves de Zipf (generar_claves_zipf) sobre tablas con y
+    sin TablaConCache: tasa de aciertos, expulsiones, colisiones y
+    búsquedas por segundo para cada capacidad (0 = sin caché).
+    """
+    claves = generar_claves_zipf(datos, n_busquedas, s, semilla=0)
+    print(f"\n*** Caché LRU (Zipf s={s}) ***")
+    print(f"{'Tabla':>36} {'capacidad':>9} {'aciertos':>9}"
+          f" {'expulsiones':>11} {'colisiones':>11} {'búsquedas/s':>12}")
+    for ClaseTabla, tam, disp_func, resol_func, nombre in CONFIGURACIONES:
+        if resol_func is None:
+            tabla = ClaseTabla(tam, disp_func)
+        else:
+            tabla = ClaseTabla(tam, disp_func, resol_func)
+        tabla.insertar_lote(datos)
+        for capacidad in capacidades:
+            envuelta = TablaConCache(tabla, capacidad) if capacidad else tabla
+            ta = time.perf_counter()
+            colisiones = wrapper_busqueda(envuelta, claves)
+            t = time.perf_counter() - ta
+            tasa = envuelta.tasa_aciertos() if capacidad else 0.0
+            expulsiones = envuelta.expulsiones if capacidad else 0
+            print(f"{nombre:>36} {capacidad:9d} {tasa:9.1%}"
+                  f" {expulsiones:11d} {colisiones:11d}"
+                  f" {len(claves) / t:12.0f}")
+    print()
+
+##Índice de prefijos
+def experimento_prefijos(datos: list[tuple[str, str]],
+                         consultas: int = 200, n: int = 10):
+    """
+    Autocompletado de las n primeras claves por prefijo con
+    IndicePrefijos frente a recorrer la tabla, para prefijos de 1 a 4
+    caracteres tomados de claves reales. Comprueba que coinciden.
+    """
+    rng = random.Random(0)
+    tabla = TablaCerrada(TAM_CERRADA, dispersionB, exploracion_lineal)
+    tabla.insertar_lote(datos)
+    ta = time.perf_counter()
+    indice = IndicePrefijos(datos)
+    t_construir = time.perf_counter() - ta
+    print("\n*** Índice de prefijos ***")
+    print(f"Construcción del índice: {t_construir * 1e3:.1f} ms")
+    print(f"{'longitud':>8} {'coincidencias':>14} {'índice[µs]':>11}"
+          f" {'recorrido[µs]':>14} {'aceleración':>12}")
+    for longitud in range(1, 5):
+        prefijos = [clave[:longitud] for clave in generar_claves_aleatorias(
+                        [d for d in datos if len(d[0]) >= longitud],
+                        consultas)]
+        tiempos = []
+        for completar in (indice.completar,
+                          lambda p, n: completar_recorriendo(tabla, p, n)):
+            ta = time.perf_counter()
+            resultados = [completar(p, n) for p in prefijos[:50]]
+            tiempos.append((time.perf_counter() - ta) / 50)
+        if resultados != [indice.completar(p, n) for p in prefijos[:50]]:
+            raise RuntimeError("El índice de prefijos no coincide")
+        # El índice es rápido: se mide con todas las consultas
+        ta = time.perf_counter()
+        for p in prefijos:
+            indice.completar(p, n)
+        tiempos[0] = (time.perf_counter() - ta) / len(prefijos)
+        media = sum(indice.contar(p) for p in prefijos) / len(prefijos)
+        print(f"{longitud:8d} {media:14.1f} {tiempos[0] * 1e6:11.2f}"
+              f" {tiempos[1] * 1e6:14.0f} {tiempos[1] / tiempos[0]:11.0f}x")
+    print()
+
+##Búsqueda por lotes
+def comparar_busqueda_lote(datos: list[tuple[str, str]]):
+    """
+    medir_tiempo_busqueda con buscar() clave a clave y con buscar_lote,
+    para n = 125..16000 y las 8 configuraciones, con las mismas claves en
+    ambos casos (se comprueba que las colisiones coinciden).
+    """
+    print("\n*** Búsqueda por lotes ***")
+    print(f"{'Tabla':>36} {'n':>6} {'uno a uno[µs]':>14} {'lote[µs]':>11}"
+          f" {'aceleración':>12}")
+    for ClaseTabla, tam, disp_func, resol_func, nombre in CONFIGURACIONES:
+        if resol_func is None:
+            tabla = ClaseTabla(tam, disp_func)
+        else:
+            tabla = ClaseTabla(tam, disp_func, resol_func)
+        tabla.insertar_lote(datos)
+        medidas = []
+        for por_lotes in (False, True):
+            random.seed(0)
+            medidas.append(medir_tiempo_busqueda(tabla, datos, 125, 8,
+                                                 por_lotes=por_lotes))
+        for n, (t, marca, colisiones) in medidas[0].items():
+            t_lote, marca_lote, colisiones_lote = medidas[1][n]
+            if colisiones != colisiones_lote:
+                raise RuntimeError(f"{nombre}: buscar_lote no coincide")
+            print(f"{nombre:>36} {marca}{n:5d} {t:14.1f}"
+                  f" {marca_lote}{t_lote:10.1f} {t / t_lote:11.2f}x")
+    print()
+
+##Filtro de Bloom para búsquedas fallidas
+def experimento_bloom(datos: list[tuple[str, str]], n_busquedas: int = 2000,
+                      proporcion_fallos: float = 0.9,
+                      tasa_fp: float = 0.01):
+    """
+    Carga con mayoría de claves ausentes (generar_claves_mixtas) sobre
+    cada configuración, sin y con TablaConFiltro: µs por búsqueda,
+    colisiones totales, falsos positivos del filtro y su tamaño.
+    """
+    claves = generar_claves_mixtas(datos, n_busquedas, proporcion_fallos,
+                                   semilla=0)
+    presentes = {clave for clave, _ in datos}
+    ausentes = sum(clave not in presentes for clave in claves)
+    print(f"\n*** Filtro de Bloom ({proporcion_fallos:.0%} fallos,"
+          f" tasa_fp={tasa_fp}) ***")
+    print(f"{'Tabla':>36} {'µs/búsq.':>9} {'con filtro':>10}"
+          f" {'colisiones':>11} {'con filtro':>10} {'f. positivos':>12}"
+          f" {'filtro[KB]':>10}")
+    for ClaseTabla, tam, disp_func, resol_func, nombre in CONFIGURACIONES:
+        if resol_func is None:
+            tabla = ClaseTabla(tam, disp_func)
+        else:
+            tabla = ClaseTabla(tam, disp_func, resol_func)
+        tabla.insertar_lote(datos)
+        filtrada = TablaConFiltro(tabla, len(datos), tasa_fp)
+        tiempos, colisiones = [], []
+        for t in (tabla, filtrada):
+            ta = time.perf_counter()
+            colisiones.append(wrapper_busqueda(t, claves))
+            tiempos.append((time.perf_counter() - ta) * 1e6 / len(claves))
+        falsos = ausentes - filtrada.descartadas
+        print(f"{nombre:>36} {tiempos[0]:9.2f} {tiempos[1]:10.2f}"
+              f" {colisiones[0]:11d} {colisiones[1]:10d}"
+              f" {falsos / ausentes:12.2%}"
+              f" {len(filtrada.filtro.bits) / 1024:10.1f}")
+    print()
+
+##Índice inverso de sinónimos
+def experimento_indice_inverso(datos: list[tuple[str, str]],
+                               consultas: int = 200):
+    """
+    Búsqueda inversa (qué claves listan una palabra como sinónimo) con
+    IndiceInverso frente a recorrer todas las entradas. Comprueba que
+    coinciden y muestra tiempo de construcción y memoria del índice.
+    """
+    ta = time.perf_counter()
+    indice = IndiceInverso(leer_sinonimos_flujo())
+    t_construir = time.perf_counter() - ta
+    memoria = (sys.getsizeof(indice.apariciones)
+               + sum(sys.getsizeof(a) for a in indice.apariciones.values()))
+    rng = random.Random(0)
+    palabras = rng.sample(sorted(indice.apariciones), consultas)
+    tiempos = []
+    for buscar in (indice.cabeceras,
+                   lambda p: cabeceras_recorriendo(datos, p)):
+        ta = time.perf_counter()
+        resultados = [buscar(p) for p in palabras]
+        tiempos.append((time.perf_counter() - ta) / len(palabras))
+        if resultados != [indice.cabeceras(p) for p in palabras]:
+            raise RuntimeError("El índice inverso no coincide")
+    apariciones = sum(len(indice.ids(p)) for p in palabras) / len(palabras)
+    print("\n*** Índice inverso ***")
+    print(f"Palabras: {len(indice.apariciones)},"
+          f" construcción: {t_construir * 1e3:.0f} ms,"
+          f" listas de apariciones: {memoria / 1e6:.2f} MB")
+    print(f"Apariciones medias por consulta: {apariciones:.1f}")
+    print(f"Índice: {tiempos[0] * 1e6:.2f} µs/consulta,"
+          f" recorrido: {tiempos[1] * 1e6:.0f} µs/consulta"
+          f" ({tiempos[1] / tiempos[0]:.0f}x)")
+    print()
+
+##Calidad de la dispersión
+# Ocupaciones que se muestran una a una en el histograma; el resto se
+# agrupa en la última columna ("9+").
+MAX_HISTOGRAMA = 8
+
+def generar_claves_ausentes(datos: list[tuple[str, str]], n: int,
+                            semilla: int | None = None) -> list[str]:
+    """
+    n claves que no están en la tabla: claves reales con una letra
+    añadida, para que compartan prefijo con las que sí están.
+    """
+    rng = random.Random(semilla)
+    presentes = {clave for clave, _ in datos}
+    letras = "abcdefghijklmnopqrstuvwxyz"
+    ausentes = []
+    while len(ausentes) < n:
+        clave = rng.choice(datos)[0] + rng.choice(letras)
+        if clave not in presentes:
+            ausentes.append(clave)
+    return ausentes
+
+def generar_claves_mixtas(datos: list[tuple[str, str]], n: int,
+                          proporcion_fallos: float,
+                          semilla: int | None = None) -> list[str]:
+    """
+    n claves a buscar de las que una proporcion_fallos (barajadas entre
+    las demás) no están en el diccionario.
+    """
+    rng = random.Random(semilla)
+    fallos = round(n * proporcion_fallos)
+    claves = (generar_claves_ausentes(datos, fallos, rng.random())
+              + [rng.choice(datos)[0] for _ in range(n - fallos)])
+    rng.shuffle(claves)
+    return claves
+
+def _percentil(ordenados: list[int], p: float) -> int:
+    # Percentil por el rango más cercano sobre una lista ya ordenada
+    if len(ordenados) == 0:
+        return 0
+    rango = max(1, -(-len(ordenados) * p // 100))
+    return ordenados[int(rango) - 1]
+
+def analizar_dispersion(tabla, datos: list[tuple[str, str]],
+                        claves_ausentes: list[str]) -> dict:
+    """
+    Inserta los datos en la tabla (vacía) y analiza su dispersión:
+    ocupación de cada posición inicial, longitud de las cadenas
+    (máxima y media de las no vacías), percentiles de colisiones al
+    buscar claves presentes y ausentes, y la chi-cuadrado de la
+    ocupación frente a una dispersión uniforme.
+    Vale para cualquier tabla con tam, dispersion y buscar().
+    """
+    insertar_datos_y_contar_colisiones(tabla, datos)
+    tam = tabla.tam
+    ocupacion = [0] * tam
+    for clave, _ in datos:
+        ocupacion[tabla.dispersion(clave, tam)] += 1
+    histograma = [0] * (MAX_HISTOGRAMA + 2)
+    for cuenta in ocupacion:
+        histograma[min(cuenta, MAX_HISTOGRAMA + 1)] += 1
+    cadenas = [cuenta for cuenta in ocupacion if cuenta > 0]
+    esperado = len(datos) / tam
+    chi2 = sum((cuenta - esperado) ** 2 for cuenta in ocupacion) / esperado
+    # Con tam - 1 grados de libertad una dispersión uniforme da
+    # chi2 ≈ tam - 1; z lo expresa en desviaciones típicas.
+    z = (chi2 - (tam - 1)) / (2 * (tam - 1)) ** 0.5
+    aciertos = sorted(tabla.buscar(clave)[1] for clave, _ in datos)
+    fallos = sorted(tabla.buscar(clave)[1] for clave in claves_ausentes)
+    return {
+        "histograma": histograma,
+        "cadena_max": max(cadenas),
+        "cadena_media": sum(cadenas) / len(cadenas),
+        "aciertos": {p: _percentil(aciertos, p) for p in (50, 95, 99)},
+        "aciertos_max": aciertos[-1],
+        "fallos": {p: _percentil(fallos, p) for p in (50, 95, 99)},
+        "fallos_max": fallos[-1] if fallos else 0,
+        "chi2": chi2,
+        "z": z,
+    }
+
+def analisis_dispersion(datos: list[tuple[str, str]],
+                        configuraciones=None, n_ausentes: int = 2000):
+    """
+    Analiza la calidad de la dispersión de cada configuración
+    (por defecto las 8 de CONFIGURACIONES) con analizar_dispersion.
+    """
+    if configuraciones is None:
+        configuraciones = CONFIGURACIONES
+    ausentes = generar_claves_ausentes(datos, n_ausentes, semilla=0)
+    cabecera_hist = " ".join(f"{i:>6}" for i in range(MAX_HISTOGRAMA + 1))
+    print("\n*** Calidad de la dispersión ***")
+    print(f"{'Tabla':>36} {'chi2':>10} {'z':>9} {'cad.max':>8}"
+          f" {'cad.media':>9} | {'aciertos p50/p95/p99/max':>24}"
+          f" | {'fallos p50/p95/p99/max':>24}")
+    histogramas = []
+    for ClaseTabla, tam, disp_func, resol_func, nombre in configuraciones:
+        if resol_func is None:
+            tabla = ClaseTabla(tam, disp_func)
+        else:
+            tabla = ClaseTabla(tam, disp_func, resol_func)
+        r = analizar_dispersion(tabla, datos, ausentes)
+        aciertos = "/".join(str(r["aciertos"][p]) for p in (50, 95, 99))
+        fallos = "/".join(str(r["fallos"][p]) for p in (50, 95, 99))
+        print(f"{nombre:>36} {r['chi2']:10.0f} {r['z']:9.1f}"
+              f" {r['cadena_max']:8d} {r['cadena_media']:9.2f} |"
+              f" {aciertos + '/' + str(r['aciertos_max']):>24} |"
+              f" {fallos + '/' + str(r['fallos_max']):>24}")
+        histogramas.append((nombre, r["histograma"]))
+    print("\nPosiciones iniciales con k claves")
+    print(f"{'Tabla':>36} {cabecera_hist} {str(MAX_HISTOGRAMA + 1) + '+':>6}")
+    for nombre, histograma in histogramas:
+        print(f"{nombre:>36} " + " ".join(f"{c:6d}" for c in histograma))
+    print()
+
+##Funciones de dispersión de clave completa
+DISPERSIONES = [
+    (dispersionA, "A"),
+    (dispersionB, "B"),
+    (dispersionFNV, "FNV-1a"),
+    (dispersionPolinomica, "Polinómica"),
+    (dispersionSipHash, "SipHash"),
+]
+
+def comparar_dispersiones(datos: list[tuple[str, str]],
+                          dispersiones=None, n_busquedas: int = 4000):
+    """
+    Para cada función de dispersión y cada tipo de tabla (abierta y
+    cerrada con las tres exploraciones) muestra las colisiones al
+    insertar sinonimos.txt y el tiempo por búsqueda de
+    medir_tiempo_busqueda con n = n_busquedas. El coste de calcular la
+    dispersión de una clave se mide aparte.
+    """
+    if dispersiones is None:
+        dispersiones = DISPERSIONES
+    tablas = [
+        (TablaAbierta, TAM_ABIERTA, None, "Abierta"),
+        (TablaCerrada, TAM_CERRADA, exploracion_lineal, "Cerrada lineal"),
+        (TablaCerrada, TAM_CERRADA, exploracion_cuadratica,
+         "Cerrada cuadrática"),
+        (TablaCerrada, TAM_CERRADA, exploracion_doble, "Cerrada doble"),
+    ]
+    claves = [clave for clave, _ in datos]
+    print("\n*** Funciones de dispersión ***")
+    print(f"{'Dispersión':>12} {'µs/clave':>9} {'Tabla':>20}"
+          f" {'colisiones':>11} {'µs/búsqueda':>12} {'col. búsqueda':>14}")
+    for disp_func, nombre in dispersiones:
+        ta = time.perf_counter()
+        for clave in claves:
+            disp_func(clave, TAM_CERRADA)
+        t_disp = (time.perf_counter() - ta) * 1e6 / len(claves)
+        for ClaseTabla, tam, resol_func, nombre_tabla in tablas:
+            if resol_func is None:
+                tabla = ClaseTabla(tam, disp_func)
+            else:
+                tabla = ClaseTabla(tam, disp_func, resol_func)
+            colisiones = insertar_datos_y_contar_colisiones(tabla, datos)
+            t, _, col_busqueda = medir_tiempo_busqueda(
+                tabla, datos, muestra_inicial=n_busquedas, muestras=1
+            )[n_busquedas]
+            print(f"{nombre:>12} {t_disp:9.2f} {nombre_tabla:>20}"
+                  f" {colisiones:11d} {t / n_busquedas:12.2f}"
+                  f" {col_busqueda:14d}")
+    print()
+
+##Robin Hood y cuckoo frente a las exploraciones clásicas
+def _estrategias_cerradas(disp_func):
+    # (nombre, tabla vacía) con el mismo tamaño y la misma dispersión
+    return [
+        ("Lineal", TablaCerrada(TAM_CERRADA, disp_func, exploracion_lineal)),
+        ("Cuadrática", TablaCerrada(TAM_CERRADA, disp_func,
+                                    exploracion_cuadratica)),
+        ("Doble", TablaCerrada(TAM_CERRADA, disp_func, exploracion_doble)),
+        ("Robin Hood", TablaRobinHood(TAM_CERRADA, disp_func)),
+        ("Cuckoo", TablaCuckoo(TAM_CERRADA, disp_func)),
+    ]
+
+def comparar_colas_exploracion(datos: list[tuple[str, str]],
+                               dispersiones=((dispersionB, "B"),
+                                             (dispersionFNV, "FNV-1a")),
+                               n_ausentes: int = 4000):
+    """
+    Colas de la distribución de colisiones por búsqueda (media, p99 y
+    máximo, para aciertos y fallos) y latencia de los fallos (p50 y p99,
+    midiendo cada búsqueda) de cada estrategia de la tabla cerrada.
+    La dispersión A se deja fuera: con ella la lineal tarda minutos.
+    """
+    ausentes = generar_claves_ausentes(datos, n_ausentes, semilla=0)
+    print("\n*** Colas de exploración de la tabla cerrada ***")
+    print(f"{'Dispersión':>10} {'Estrategia':>11} |"
+          f" {'aciertos media/p99/max':>22} | {'fallos media/p99/max':>20}"
+          f" | {'fallo p50[µs]':>13} {'fallo p99[µs]':>13}")
+    for disp_func, nombre_disp in dispersiones:
+        for nombre, tabla in _estrategias_cerradas(disp_func):
+            insertar_datos_y_contar_colisiones(tabla, datos)
+            columnas = []
+            for claves in ([clave for clave, _ in datos], ausentes):
+                colisiones = sorted(tabla.buscar(c)[1] for c in claves)
+                columnas.append(f"{sum(colisiones) / len(colisiones):.2f}"
+                                f"/{_percentil(colisiones, 99)}"
+                                f"/{colisiones[-1]}")
+            latencias = []
+            for clave in ausentes:
+                ta = time.perf_counter_ns()
+                tabla.buscar(clave)
+                latencias.append(time.perf_counter_ns() - ta)
+            latencias.sort()
+            print(f"{nombre_disp:>10} {nombre:>11} | {columnas[0]:>22} |"
+                  f" {columnas[1]:>20} |"
+                  f" {_percentil(latencias, 50) / 1e3:13.2f}"
+                  f" {_percentil(latencias, 99) / 1e3:13.2f}")
+    print()
+
 if __name__ == "__main__":
     #Configuración del tamaño para ambos tipos de tablas
     validar_tablas()
@@ -577,6 +2963,22 @@ if __name__ == "__main__":
         print(f"\n--- Medición de tiempos de búsqueda, iteración {i+1} ---")
         main_complejidad(datos)
         i+=1
+    experimento_redimensionado(datos)
+    experimento_borrado(datos)
+    comparar_almacenamiento(datos)
+    comparar_almacenamiento_abierta(datos)
+    comparar_carga_lote(datos)
+    experimento_snapshot(datos)
+    experimento_carga_flujo(datos)
+    experimento_servidor(datos)
+    experimento_cache(datos)
+    experimento_prefijos(datos)
+    comparar_busqueda_lote(datos)
+    experimento_bloom(datos)
+    experimento_indice_inverso(datos)
+    analisis_dispersion(datos)
+    comparar_dispersiones(datos)
+    comparar_colas_exploracion(datos)
     print("\n--- Fin de la práctica ---")
     #Creo que es la práctica entre entender
     # conceptos y programar que más tiempo me ha llevado.